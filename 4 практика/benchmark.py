@@ -0,0 +1,68 @@
+import time
+import tracemalloc
+from lex import Lexer
+
+# Фрагмент программы, который повторяется до нужного размера
+SNIPPET = '''
+    counter as counter + 0b1011 * total - 125D;
+    if (counter < limit) then value as 0o17 else value as 0h1F;
+    /* пересчёт результата */
+    result as result / 3.14e+2;
+    write(counter, 'значение', total);
+'''
+
+
+# Фрагмент из одних имён и пробелов — случай, на который рассчитан векторный режим
+NAMES_SNIPPET = '''
+        counter   as   total  +  value * limit ;
+        result    as   result -  counter / total ;
+'''
+
+
+def make_program(size, snippet=SNIPPET):
+    body = snippet * (size // len(snippet) + 1)
+    return "{\n% counter, total, value, limit;\n! result;\n" + body + "}\n"
+
+
+# Сколько байт остаётся занято результатом разбора и сколько времени он занял.
+# Время меряется отдельным запуском без tracemalloc, чтобы трассировка его не искажала
+def measure(tokenize, text):
+    start = time.perf_counter()
+    tokenize(text)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    tokens = tokenize(text)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tokens, used, elapsed
+
+
+# Автомат (process_state) — исходный разбор: на каждую лексему новый кортеж и новые
+# строки. Быстрый режим делит одинаковые лексемы, TokenStream хранит только буферы
+def run_benchmark(size=10_000_000):
+    text = make_program(size)
+    results = [
+        ("автомат", *measure(lambda code: Lexer(code).tokenize(fast=False), text)),
+        ("список кортежей", *measure(lambda code: Lexer(code).tokenize(), text)),
+        ("TokenStream", *measure(lambda code: Lexer(code).tokenize_stream(), text)),
+    ]
+    print(f"Размер программы: {len(text)} символов")
+    report(results)
+    # Векторный режим (NumPy) выигрывает на именах и пробелах; строки, комментарии
+    # и числа с префиксом или дробной частью он разбирает шаблоном по одной
+    text = make_program(size, NAMES_SNIPPET)
+    results = [
+        ("список кортежей", *measure(lambda code: Lexer(code).tokenize(), text)),
+        ("NumPy", *measure(lambda code: Lexer(code).tokenize(vectorized=True), text)),
+    ]
+    print(f"Имена и пробелы: {len(text)} символов")
+    report(results)
+
+
+def report(results):
+    for name, tokens, used, elapsed in results:
+        print(f"{name:>16}: {len(tokens)} лексем, {used / len(tokens):.1f} байт/лексему, {elapsed:.2f} с")
+
+
+if __name__ == "__main__":
+    run_benchmark()
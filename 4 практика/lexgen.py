@@ -0,0 +1,317 @@
+import os
+from array import array
+from lex import Lexer
+
+# Генератор табличного лексера: по спецификации лексем строит минимальный ДКА
+# и записывает его плотную таблицу переходов в lextable.py. После изменения
+# Lexer.TW, TD или TYPES таблицу нужно пересоздать: python lexgen.py
+
+# Символы не из ASCII автомат различает по isalpha()/isdigit()/isalnum(),
+# поэтому в алфавите они представлены четырьмя псевдосимволами
+ALPHA, DIGIT, NUMERIC, OTHER = range(128, 132)
+SYMBOLS = range(132)
+LETTERS = frozenset(map(ord, 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')) | {ALPHA}
+DIGITS = frozenset(map(ord, '0123456789')) | {DIGIT}
+ESCAPES = {
+    'a': LETTERS,  # isalpha()
+    'd': DIGITS,  # isdigit()
+    'w': LETTERS | DIGITS | {NUMERIC, ord('_')},  # isalnum() или '_'
+}
+CONTROL = {'n': '\n', 'r': '\r', 't': '\t'}
+
+
+# Спецификация: правила (класс лексемы, регулярное выражение) по убыванию приоритета.
+# Все выражения замкнуты по префиксам, как разбор автомата Lexer: он не откатывается,
+# поэтому, например, '1e' — число, а незакрытый комментарий идёт до конца текста.
+# Ключевые слова и разделители (Lexer.TOKEN_KINDS) сюда не входят: они собираются
+# в бор и объединяются с автоматом правил (build_dfa), их класс важнее ID
+def token_spec():
+    spec = [
+        ('SPACE', r"[ \n\r\t]+"),
+        ('COMMENT', r"/\*+([^*/][^*]*\*+)*([^*/][^*]*)?/?"),
+        ('ID', r"\a\w*"),
+        ('NUMBER', r"0[Bb][01]*|0[Oo][0-7]*|0[Hh][\dA-Fa-f]*|\d+((\.\d*)?[Ee][+\-]?\d*|\.\d*|[Dd])?"),
+        ('STRING', r"'[^']*'?"),
+    ]
+    return spec
+
+
+# Разбор регулярного выражения в НКА (построение Томпсона).
+# Поддерживаются | * + ? скобки, классы [...] и [^...], экранирование и \a \d \w
+class RegexParser:
+    def __init__(self, pattern, nfa):
+        self.pattern = pattern
+        self.pos = 0
+        self.nfa = nfa
+
+    def parse(self):
+        start, end = self.parse_alternation()
+        if self.pos != len(self.pattern):
+            raise ValueError(f"Unexpected '{self.pattern[self.pos]}' in {self.pattern!r}")
+        return start, end
+
+    def peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def parse_alternation(self):
+        branches = [self.parse_concatenation()]
+        while self.peek() == '|':
+            self.pos += 1
+            branches.append(self.parse_concatenation())
+        if len(branches) == 1:
+            return branches[0]
+        start, end = self.nfa.state(), self.nfa.state()
+        for branch_start, branch_end in branches:
+            self.nfa.epsilon(start, branch_start)
+            self.nfa.epsilon(branch_end, end)
+        return start, end
+
+    def parse_concatenation(self):
+        start = end = self.nfa.state()
+        while self.peek() not in (None, '|', ')'):
+            piece_start, piece_end = self.parse_repetition()
+            self.nfa.epsilon(end, piece_start)
+            end = piece_end
+        return start, end
+
+    def parse_repetition(self):
+        start, end = self.parse_atom()
+        while self.peek() in ('*', '+', '?'):
+            operator = self.pattern[self.pos]
+            self.pos += 1
+            outer_start, outer_end = self.nfa.state(), self.nfa.state()
+            self.nfa.epsilon(outer_start, start)
+            self.nfa.epsilon(end, outer_end)
+            if operator != '+':
+                self.nfa.epsilon(outer_start, outer_end)
+            if operator != '?':
+                self.nfa.epsilon(end, start)
+            start, end = outer_start, outer_end
+        return start, end
+
+    def parse_atom(self):
+        char = self.peek()
+        if char == '(':
+            self.pos += 1
+            start, end = self.parse_alternation()
+            if self.peek() != ')':
+                raise ValueError(f"Missing ')' in {self.pattern!r}")
+            self.pos += 1
+            return start, end
+        if char == '[':
+            symbols = self.parse_class()
+        else:
+            symbols = self.parse_symbol()
+        start, end = self.nfa.state(), self.nfa.state()
+        self.nfa.edge(start, symbols, end)
+        return start, end
+
+    def parse_symbol(self):
+        char = self.pattern[self.pos]
+        self.pos += 1
+        if char != '\\':
+            return frozenset([ord(char)])
+        char = self.pattern[self.pos]
+        self.pos += 1
+        if char in ESCAPES:
+            return ESCAPES[char]
+        return frozenset([ord(CONTROL.get(char, char))])
+
+    def parse_class(self):
+        self.pos += 1  # [
+        negate = self.peek() == '^'
+        if negate:
+            self.pos += 1
+        symbols = set()
+        while self.peek() != ']':
+            if self.peek() is None:
+                raise ValueError(f"Missing ']' in {self.pattern!r}")
+            first = self.parse_symbol()
+            if self.peek() == '-' and self.pattern[self.pos + 1:self.pos + 2] not in ('', ']'):
+                self.pos += 1
+                last = self.parse_symbol()
+                symbols.update(range(min(first), max(last) + 1))
+            else:
+                symbols.update(first)
+        self.pos += 1  # ]
+        if negate:
+            return frozenset(SYMBOLS) - symbols
+        return frozenset(symbols)
+
+
+class NFA:
+    def __init__(self):
+        self.edges = []  # Для каждого состояния: список (множество символов, состояние)
+        self.epsilons = []
+        self.accepting = {}  # Состояние -> (приоритет, класс лексемы)
+
+    def state(self):
+        self.edges.append([])
+        self.epsilons.append([])
+        return len(self.edges) - 1
+
+    def edge(self, source, symbols, target):
+        self.edges[source].append((symbols, target))
+
+    def epsilon(self, source, target):
+        self.epsilons[source].append(target)
+
+    def closure(self, states):
+        result = set(states)
+        stack = list(states)
+        while stack:
+            for target in self.epsilons[stack.pop()]:
+                if target not in result:
+                    result.add(target)
+                    stack.append(target)
+        return frozenset(result)
+
+
+# Разбиение алфавита на классы символов, неразличимые ни одним переходом НКА.
+# Каждый символ из alone получает свой класс (по нему идут переходы бора)
+def symbol_classes(nfa, alone=()):
+    signatures = {}
+    for symbol in SYMBOLS:
+        signature = tuple(symbol in symbols for edges in nfa.edges for symbols, _ in edges)
+        signature += (symbol if symbol in alone else None,)
+        signatures.setdefault(signature, []).append(symbol)
+    classes = [0] * len(SYMBOLS)
+    for number, symbols in enumerate(signatures.values()):
+        for symbol in symbols:
+            classes[symbol] = number
+    return classes, len(signatures)
+
+
+# Построение ДКА подмножеств для правил spec, объединение с бором литеральных
+# лексем literals (лексема -> класс) и минимизация (разбиение Мура).
+# Возвращает переходы (список строк по классам символов, 0 — тупик),
+# классы лексем принимающих состояний и номер начального состояния
+def build_dfa(spec, literals):
+    nfa = NFA()
+    start = nfa.state()
+    for priority, (kind, pattern) in enumerate(spec):
+        rule_start, rule_end = RegexParser(pattern, nfa).parse()
+        nfa.epsilon(start, rule_start)
+        nfa.accepting[rule_end] = (priority, kind)
+    classes, class_count = symbol_classes(nfa, {ord(char) for lexeme in literals for char in lexeme})
+    representatives = {}
+    for symbol, number in enumerate(classes):
+        representatives.setdefault(number, symbol)
+
+    initial = nfa.closure([start])
+    numbers = {frozenset(): 0, initial: 1}
+    subsets = [frozenset(), initial]
+    rows = []
+    index = 0
+    while index < len(subsets):
+        subset = subsets[index]
+        row = []
+        for number in range(class_count):
+            symbol = representatives[number]
+            targets = nfa.closure([target for state in subset for symbols, target in nfa.edges[state] if symbol in symbols])
+            if targets not in numbers:
+                numbers[targets] = len(subsets)
+                subsets.append(targets)
+            row.append(numbers[targets])
+        rows.append(row)
+        index += 1
+    kinds = []
+    for subset in subsets:
+        accepted = [nfa.accepting[state] for state in subset if state in nfa.accepting]
+        kinds.append(min(accepted)[1] if accepted else None)
+
+    trie, trie_kinds = trie_rows(literals, classes, class_count)
+    rows, kinds = merge(trie, trie_kinds, rows, kinds)
+    rows, kinds, start = minimize(rows, kinds, 1)
+    return classes, rows, kinds, start
+
+
+# ДКА-бор литеральных лексем: состояние — префикс лексемы, переходы по классам
+# символов. Как у ДКА подмножеств, 0 — тупик, 1 — начальное состояние
+def trie_rows(literals, classes, class_count):
+    prefixes = {'': 1}
+    rows = [[0] * class_count, [0] * class_count]
+    kinds = [None, None]
+    for lexeme, kind in literals.items():
+        for length in range(1, len(lexeme) + 1):
+            if lexeme[:length] not in prefixes:
+                prefixes[lexeme[:length]] = len(rows)
+                rows.append([0] * class_count)
+                kinds.append(None)
+                rows[prefixes[lexeme[:length - 1]]][classes[ord(lexeme[length - 1])]] = prefixes[lexeme[:length]]
+        kinds[prefixes[lexeme]] = kind
+    return rows, kinds
+
+
+# Произведение автоматов (строятся только пары, достижимые из пары начальных
+# состояний 1): класс лексемы берётся из первого автомата, если он её принимает,
+# поэтому ключевое слово важнее идентификатора. Пара тупиков — тупик 0
+def merge(first_rows, first_kinds, second_rows, second_kinds):
+    numbers = {(0, 0): 0, (1, 1): 1}
+    pairs = [(0, 0), (1, 1)]
+    rows = []
+    kinds = []
+    index = 0
+    while index < len(pairs):
+        first, second = pairs[index]
+        row = []
+        for pair in zip(first_rows[first], second_rows[second]):
+            if pair not in numbers:
+                numbers[pair] = len(pairs)
+                pairs.append(pair)
+            row.append(numbers[pair])
+        rows.append(row)
+        kinds.append(first_kinds[first] or second_kinds[second])
+        index += 1
+    return rows, kinds
+
+
+def minimize(rows, kinds, start):
+    # Начальное разбиение — по классу лексемы; тупик (0) остаётся отдельным блоком
+    blocks = {}
+    block_of = [blocks.setdefault((state == 0, kinds[state]), len(blocks)) for state in range(len(rows))]
+    while True:
+        signatures = {}
+        refined = [signatures.setdefault((block_of[state], tuple(block_of[target] for target in row)), len(signatures))
+                   for state, row in enumerate(rows)]
+        if len(signatures) == len(set(block_of)):
+            break
+        block_of = refined
+    # Перенумерация: тупик — 0, остальные в порядке первого появления
+    order = {block_of[0]: 0}
+    for state in range(len(rows)):
+        order.setdefault(block_of[state], len(order))
+    new_rows = [None] * len(order)
+    new_kinds = [None] * len(order)
+    for state, row in enumerate(rows):
+        block = order[block_of[state]]
+        new_rows[block] = [order[block_of[target]] for target in row]
+        new_kinds[block] = kinds[state]
+    return new_rows, new_kinds, order[block_of[start]]
+
+
+def write_table(path, spec, literals):
+    classes, rows, kinds, start = build_dfa(spec, literals)
+    class_count = len(rows[0])
+    transitions = array('B' if len(rows) < 256 else 'H', [target for row in rows for target in row])
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("# Таблица лексера, созданная lexgen.py. Не редактировать вручную\n")
+        file.write("from array import array\n\n")
+        file.write(f"CLASS_COUNT = {class_count}\n")
+        file.write(f"START = {start}\n")
+        file.write("# Классы символов ASCII и символов вне ASCII (буква, цифра, прочий isalnum(), остальные)\n")
+        file.write(f"ASCII_CLASSES = {bytes(classes[:128])!r}\n")
+        file.write(f"ALPHA_CLASS, DIGIT_CLASS, NUMERIC_CLASS, OTHER_CLASS = {tuple(classes[128:])!r}\n")
+        file.write(f"# Переход из состояния s по классу c: TRANSITIONS[s * CLASS_COUNT + c], 0 — тупик\n")
+        file.write(f"TRANSITIONS = array({transitions.typecode!r}, [\n")
+        for row in rows:
+            file.write("    " + ", ".join(map(str, row)) + ",\n")
+        file.write("])\n")
+        file.write("# Класс лексемы, которую принимает состояние\n")
+        file.write(f"ACCEPT = {kinds!r}\n")
+    return len(rows), class_count
+
+
+if __name__ == "__main__":
+    states, class_count = write_table(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lextable.py'), token_spec(), Lexer.TOKEN_KINDS)
+    print(f"lextable.py: {states} состояний, {class_count} классов символов")
@@ -0,0 +1,341 @@
+from collections import deque
+from main import create_automaton, digits, letters, process_input
+
+EPSILON = ''  # Символ пустого перехода НКА
+
+
+# Символы, по которым есть переходы (по порядку, чтобы нумерация состояний
+# не зависела от хеширования строк)
+def alphabet(transitions):
+    return sorted({symbol for _, symbol in transitions})
+
+
+# Недетерминированный конечный автомат. transitions: (состояние, символ) -> множество
+# состояний, символ EPSILON — пустой переход
+class NFA:
+    def __init__(self, states, initial_state, final_states, transitions):
+        self.states = set(states)
+        self.alphabet = [symbol for symbol in alphabet(transitions) if symbol != EPSILON]
+        self.initial_state = initial_state
+        self.final_states = set(final_states)
+        self.transitions = {key: set(targets) for key, targets in transitions.items()}
+        self.closures = {}  # Запомненные ε-замыкания множеств состояний
+
+    # Все состояния, достижимые из states по пустым переходам
+    def epsilon_closure(self, states):
+        states = frozenset(states)
+        if states not in self.closures:
+            result = set(states)
+            stack = list(states)
+            while stack:
+                for target in self.transitions.get((stack.pop(), EPSILON), ()):
+                    if target not in result:
+                        result.add(target)
+                        stack.append(target)
+            self.closures[states] = frozenset(result)
+        return self.closures[states]
+
+    def move(self, states, symbol):
+        return {target for state in states for target in self.transitions.get((state, symbol), ())}
+
+    # Построение подмножеств. Состояния ДКА нумеруются с 0 (начальное) в порядке обхода;
+    # пустое подмножество не добавляется, переход в него просто отсутствует
+    def to_dfa(self):
+        initial = self.epsilon_closure([self.initial_state])
+        numbers = {initial: 0}
+        queue = deque([initial])
+        transition_function = {}
+        while queue:
+            subset = queue.popleft()
+            for symbol in self.alphabet:
+                target = self.epsilon_closure(self.move(subset, symbol))
+                if not target:
+                    continue
+                if target not in numbers:
+                    numbers[target] = len(numbers)
+                    queue.append(target)
+                transition_function[(numbers[subset], symbol)] = numbers[target]
+        final_states = {number for subset, number in numbers.items() if subset & self.final_states}
+        return DFA(set(numbers.values()), 0, final_states, transition_function)
+
+
+# Детерминированный конечный автомат в том же виде, что create_automaton() в main.py:
+# отсутствующий переход означает отказ. labels — метка (класс слова) каждого
+# конечного состояния, по умолчанию True
+class DFA:
+    def __init__(self, states, initial_state, final_states, transition_function, labels=None):
+        self.states = set(states)
+        self.alphabet = alphabet(transition_function)
+        self.initial_state = initial_state
+        self.final_states = set(final_states)
+        self.transition_function = dict(transition_function)
+        self.labels = dict(labels) if labels is not None else dict.fromkeys(self.final_states, True)
+
+    def accepts(self, symbols):
+        state = self.initial_state
+        for symbol in symbols:
+            state = self.transition_function.get((state, symbol))
+            if state is None:
+                return False
+        return state in self.final_states
+
+    # Метка конечного состояния, в котором закончилось слово, или None
+    def classify(self, symbols):
+        state = self.initial_state
+        for symbol in symbols:
+            state = self.transition_function.get((state, symbol))
+            if state is None:
+                return None
+        return self.labels.get(state)
+
+    # Кортеж (states, initial_state, final_states, transition_function) для process_input
+    def as_tuple(self):
+        return self.states, self.initial_state, self.final_states, self.transition_function
+
+    def reachable_states(self):
+        reached = {self.initial_state}
+        stack = [self.initial_state]
+        while stack:
+            state = stack.pop()
+            for symbol in self.alphabet:
+                target = self.transition_function.get((state, symbol))
+                if target is not None and target not in reached:
+                    reached.add(target)
+                    stack.append(target)
+        return reached
+
+    def equivalent(self, other):
+        return self.counterexample(other) is None
+
+    # Проверка эквивалентности алгоритмом Хопкрофта—Карпа: пары состояний, достижимые
+    # одним словом, объединяются в системе непересекающихся множеств, поэтому каждая
+    # пара рассматривается не больше одного раза. Обход в ширину даёт кратчайшее слово
+    # (список символов), которое принимает ровно один из автоматов, или None.
+    # Отсутствующий переход ведёт в тупиковое состояние None
+    def counterexample(self, other):
+        symbols = sorted(set(self.alphabet) | set(other.alphabet))
+        parent = {}
+        size = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        def union(first, second):
+            first, second = find(first), find(second)
+            if first == second:
+                return False
+            if size.get(first, 1) < size.get(second, 1):
+                first, second = second, first
+            parent[second] = first
+            size[first] = size.get(first, 1) + size.get(second, 1)
+            return True
+
+        def word(pair):
+            symbols_back = []
+            while pair in previous:
+                pair, symbol = previous[pair]
+                symbols_back.append(symbol)
+            return symbols_back[::-1]
+
+        start = (self.initial_state, other.initial_state)
+        if (start[0] in self.final_states) != (start[1] in other.final_states):
+            return []
+        union((0, start[0]), (1, start[1]))
+        previous = {}  # Пара -> (пара, из которой в неё пришли, символ)
+        queue = deque([start])
+        while queue:
+            pair = queue.popleft()
+            first, second = pair
+            for symbol in symbols:
+                target = (self.transition_function.get((first, symbol)) if first is not None else None,
+                          other.transition_function.get((second, symbol)) if second is not None else None)
+                if not union((0, target[0]), (1, target[1])):
+                    continue
+                previous[target] = (pair, symbol)  # Пара встретилась впервые: иначе уже объединена
+                if (target[0] in self.final_states) != (target[1] in other.final_states):
+                    return word(target)
+                queue.append(target)
+        return None
+
+    # Минимизация алгоритмом Хопкрофта, O(n log n). Конечные состояния с разными метками
+    # не склеиваются. Недостижимые состояния отбрасываются,
+    # на время разбиения добавляется тупиковое состояние None, затем его блок удаляется.
+    # Разбиение уточняемое: состояния лежат в одном списке, блок — отрезок
+    # [first, end) этого списка. Задетые состояния переставляются в конец своего блока,
+    # деление переименовывает только меньшую часть, дополнение не строится.
+    # Состояния результата нумеруются с 0 (начальное) в порядке обхода в ширину
+    def minimize(self):
+        states = self.reachable_states()
+        dead = None
+        inverse = {}  # (состояние, символ) -> состояния, переходящие в него по символу
+        for state in states | {dead}:
+            for symbol in self.alphabet:
+                target = self.transition_function.get((state, symbol)) if state is not None else None
+                inverse.setdefault((target, symbol), []).append(state)
+
+        final = states & self.final_states
+        groups = {None: [dead]}  # Начальное разбиение: по меткам, прочие состояния — с тупиком
+        for state in states:
+            groups.setdefault(self.labels.get(state, True) if state in final else None, []).append(state)
+        elements = []  # Состояния, сгруппированные по блокам
+        first, end = [], []  # Границы блоков в elements
+        for group in groups.values():
+            first.append(len(elements))
+            elements.extend(group)
+            end.append(len(elements))
+        position = {state: index for index, state in enumerate(elements)}
+        block_of = {state: number for number, group in enumerate(groups.values()) for state in group}
+        marked = [0] * len(first)  # Сколько состояний в конце блока задето
+        # Ждут все начальные блоки, кроме самого большого
+        waiting = set(range(len(first))) - {max(range(len(first)), key=lambda number: end[number] - first[number])}
+        while waiting:
+            block = waiting.pop()
+            splitter = elements[first[block]:end[block]]
+            for symbol in self.alphabet:
+                touched = []
+                for target in splitter:
+                    for state in inverse.get((target, symbol), ()):
+                        number = block_of[state]
+                        index = position[state]
+                        tail = end[number] - marked[number] - 1  # Первое место задетой части
+                        if index > tail:
+                            continue  # Уже задето
+                        if not marked[number]:
+                            touched.append(number)
+                        other = elements[tail]
+                        elements[index], elements[tail] = other, state
+                        position[other], position[state] = index, tail
+                        marked[number] += 1
+                for number in touched:
+                    border = end[number] - marked[number]
+                    marked[number] = 0
+                    if border == first[number]:
+                        continue  # Задет весь блок
+                    # Блок делится: меньшая часть получает новый номер
+                    if end[number] - border <= border - first[number]:
+                        first.append(border)
+                        end.append(end[number])
+                        end[number] = border
+                    else:
+                        first.append(first[number])
+                        end.append(border)
+                        first[number] = border
+                    marked.append(0)
+                    for state in elements[first[-1]:end[-1]]:
+                        block_of[state] = len(first) - 1
+                    # Если блок уже ждёт, ждать должны обе части; иначе достаточно меньшей
+                    waiting.add(len(first) - 1)
+
+        dead_block = block_of[dead]
+        numbers = {block_of[self.initial_state]: 0}
+        queue = deque([self.initial_state])
+        transition_function = {}
+        while queue:
+            state = queue.popleft()
+            for symbol in self.alphabet:
+                target = self.transition_function.get((state, symbol))
+                if target is None or block_of[target] == dead_block:
+                    continue
+                if block_of[target] not in numbers:
+                    numbers[block_of[target]] = len(numbers)
+                    queue.append(target)
+                transition_function[(numbers[block_of[state]], symbol)] = numbers[block_of[target]]
+        labels = {numbers[block_of[state]]: self.labels.get(state, True) for state in final if block_of[state] in numbers}
+        return DFA(set(numbers.values()), 0, set(labels), transition_function, labels)
+
+
+# ДКА-бор для списка слов: состояние — префикс слова. words — список (все слова
+# получают метку label) или словарь слово -> метка
+def trie_dfa(words, label='KEYWORD'):
+    if not isinstance(words, dict):
+        words = dict.fromkeys(words, label)
+    prefixes = {'': 0}
+    transition_function = {}
+    labels = {}
+    for word, word_label in words.items():
+        for length in range(1, len(word) + 1):
+            if word[:length] not in prefixes:
+                prefixes[word[:length]] = len(prefixes)
+                transition_function[(prefixes[word[:length - 1]], word[length - 1])] = prefixes[word[:length]]
+        labels[prefixes[word]] = word_label
+    return DFA(set(prefixes.values()), 0, set(labels), transition_function, labels)
+
+
+# Автомат над типами символов (как в create_automaton()) -> автомат над самими
+# символами; symbol_chars: тип -> символы этого типа
+def expand_symbols(dfa, symbol_chars):
+    transition_function = {(state, char): target
+                           for (state, symbol), target in dfa.transition_function.items()
+                           for char in symbol_chars[symbol]}
+    return DFA(dfa.states, dfa.initial_state, dfa.final_states, transition_function, dfa.labels)
+
+
+# Произведение автоматов, распознающее объединение языков. Метка слова берётся
+# из первого автомата, если он его принимает (например, ключевое слово важнее
+# идентификатора). Строятся только достижимые пары состояний
+def merge(first, second):
+    symbols = sorted(set(first.alphabet) | set(second.alphabet))
+    start = (first.initial_state, second.initial_state)
+    numbers = {start: 0}
+    queue = deque([start])
+    transition_function = {}
+    labels = {}
+    while queue:
+        pair = queue.popleft()
+        if pair[0] in first.final_states:
+            labels[numbers[pair]] = first.labels.get(pair[0], True)
+        elif pair[1] in second.final_states:
+            labels[numbers[pair]] = second.labels.get(pair[1], True)
+        for symbol in symbols:
+            target = (first.transition_function.get((pair[0], symbol)) if pair[0] is not None else None,
+                      second.transition_function.get((pair[1], symbol)) if pair[1] is not None else None)
+            if target == (None, None):
+                continue
+            if target not in numbers:
+                numbers[target] = len(numbers)
+                queue.append(target)
+            transition_function[(numbers[pair], symbol)] = numbers[target]
+    return DFA(set(numbers.values()), 0, set(labels), transition_function, labels)
+
+
+# Один ДКА над символами для ключевых слов и идентификаторов: classify() даёт
+# 'KEYWORD' или 'ID' за один проход, без поиска слова в списке. Переходы в нём по
+# самим символам, и его as_tuple() исполняют те же process_input, accept_many и
+# find_all из main.py, что и create_automaton(); classify добавляет только метку.
+# identifier — автомат в виде create_automaton() (по умолчанию он сам)
+def keyword_automaton(words, identifier=None, label='KEYWORD'):
+    identifier = DFA(*(identifier or create_automaton()))
+    identifier.labels = dict.fromkeys(identifier.final_states, 'ID')
+    identifier = expand_symbols(identifier, {'letter': letters, 'digit': digits, '_': '_'})
+    return merge(trie_dfa(words, label), identifier).minimize()
+
+
+# НКА идентификатора из main.py: буква, затем буквы, цифры и '_' (через ε-переходы)
+def identifier_nfa():
+    transitions = {
+        (0, 'letter'): {1},
+        (1, EPSILON): {2},
+        (2, 'letter'): {3},
+        (2, 'digit'): {3},
+        (2, '_'): {3},
+        (3, EPSILON): {2},
+    }
+    return NFA({0, 1, 2, 3}, 0, {1, 3}, transitions)
+
+
+if __name__ == "__main__":
+    dfa = identifier_nfa().to_dfa()
+    minimal = dfa.minimize()
+    print(f"ДКА: {len(dfa.states)} состояний, минимальный ДКА: {len(minimal.states)}")
+    for (state, symbol), target in sorted(minimal.transition_function.items()):
+        print(f"  {state} --{symbol}--> {target}")
+    print(f"Конечные состояния: {sorted(minimal.final_states)}")
+    words = ["if", "then", "else", "while", "do", "for", "to", "read", "write", "true", "false", "as", "not", "or", "and"]
+    keywords = keyword_automaton(words)
+    print(f"Ключевые слова и идентификаторы: {len(keywords.states)} состояний")
+    for word in ["if", "iff", "while", "whilst", "x1", "1x"]:
+        print(f"  {word}: {keywords.classify(word)}, process_input: {process_input(word, *keywords.as_tuple())}")
@@ -1,5 +1,10 @@
 import re
 
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Без NumPy accept_many проверяет строки по одной
+
 letters = set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
 digits = set('0123456789')
 
@@ -23,17 +28,113 @@ def create_automaton():
     }
     return states, initial_state, final_states, transition_function
 
+# Переходы автомата задаются по типу символа ('letter', 'digit', '_', как в
+# create_automaton) или по самому символу (как в automata.keyword_automaton);
+# переход по символу важнее перехода по его типу. Оба вида понимают process_input,
+# accept_many и find_all.
+# Классы символов плотной таблицы; OTHER — любой другой байт, PAD — заполнитель
+# после конца строки (оставляет состояние без изменений)
+CHAR_TYPES = ['letter', 'digit', '_']
+OTHER, PAD = len(CHAR_TYPES), len(CHAR_TYPES) + 1
+BATCH_SIZE = 1 << 16  # Строк в одном проходе accept_many
+CELL_LIMIT = 1 << 24  # Символов (строк × ширина) в одном проходе accept_many
+MAX_WIDTH = 1 << 12  # Более длинные строки accept_many проверяет по одной (process_input)
+
+# Тип символа для переходов по типу; None — символ без типа
+def char_type_of(char):
+    if char in letters:
+        return 'letter'
+    if char in digits:
+        return 'digit'
+    if char == '_':
+        return '_'
+    return None
+
+# Плотная таблица автомата: переход из s по классу c — table[s, c].
+# Состояние len(states) — тупик, в нём остаются навсегда; тип элементов таблицы —
+# наименьший беззнаковый, вмещающий номера всех состояний. Символ, по которому
+# есть переходы, получает свой класс после PAD.
+# byte_classes отображает каждый из 256 байтов в класс символа.
+# None — в переходах есть символы вне ASCII (их нельзя проверять по байтам)
+def compile_automaton(states, initial_state, final_states, transition_function):
+    chars = sorted({symbol for _, symbol in transition_function} - set(CHAR_TYPES))
+    if not all(char.isascii() for char in chars):
+        return None
+    dead = len(states)
+    table = numpy.full((dead + 1, PAD + 1 + len(chars)), dead, dtype=numpy.min_scalar_type(dead))
+    table[:, PAD] = numpy.arange(dead + 1)
+    byte_classes = numpy.full(256, OTHER, dtype=numpy.uint8)
+    for char_class, chars_of_type in enumerate([letters, digits, '_']):
+        byte_classes[list(map(ord, chars_of_type))] = char_class
+    for (state, symbol), target in transition_function.items():
+        if symbol in CHAR_TYPES:
+            table[state, CHAR_TYPES.index(symbol)] = target
+    for char_class, char in enumerate(chars, PAD + 1):
+        # Без перехода по символу действует переход по его типу
+        if char_type_of(char) is not None:
+            table[:, char_class] = table[:, CHAR_TYPES.index(char_type_of(char))]
+        for state in range(dead):
+            if (state, char) in transition_function:
+                table[state, char_class] = transition_function[(state, char)]
+        byte_classes[ord(char)] = char_class
+    accepting = numpy.zeros(dead + 1, dtype=bool)
+    accepting[list(final_states)] = True
+    return table, byte_classes, initial_state, accepting
+
+# Проверка множества строк (str или bytes в UTF-8): все строки пачки проходят
+# автомат одновременно, по одному столбцу символов за шаг. Строки идут в пачки
+# по возрастанию длины, и пачка не больше CELL_LIMIT символов вместе с
+# заполнителями, поэтому одна длинная строка не раздувает всю пачку; строки
+# длиннее MAX_WIDTH проверяются по одной. Возвращает массив bool (или список без NumPy)
+def accept_many(strings, automaton=None):
+    automaton = automaton or create_automaton()
+    compiled = compile_automaton(*automaton) if numpy is not None else None
+    if compiled is None:
+        return [check_one(string, automaton) for string in strings]
+    table, byte_classes, initial_state, accepting = compiled
+    # Символы вне ASCII дают байты >= 128, то есть класс OTHER
+    encoded = [string if isinstance(string, bytes) else string.encode('utf-8') for string in strings]
+    result = numpy.zeros(len(encoded), dtype=bool)
+    lengths = numpy.fromiter(map(len, encoded), dtype=numpy.int64, count=len(encoded))
+    order = numpy.argsort(lengths, kind='stable')
+    sorted_lengths = lengths[order]
+    short = int(numpy.searchsorted(sorted_lengths, MAX_WIDTH, side='right'))
+    start = 0
+    while start < short:
+        end = min(start + BATCH_SIZE, short)
+        while end - start > 1 and (end - start) * int(sorted_lengths[end - 1]) > CELL_LIMIT:
+            end = start + max(1, CELL_LIMIT // int(sorted_lengths[end - 1]))
+        rows = order[start:end]
+        width = int(sorted_lengths[end - 1])
+        columns = numpy.full((len(rows), width), PAD, dtype=numpy.uint8)
+        joined = b''.join([encoded[row] for row in rows.tolist()])
+        columns[numpy.arange(width) < sorted_lengths[start:end, None]] = byte_classes[numpy.frombuffer(joined, dtype=numpy.uint8)]
+        current = numpy.full(len(rows), initial_state, dtype=table.dtype)
+        for column in columns.T:
+            current = table[current, column]
+        result[rows] = accepting[current]
+        start = end
+    for row in order[short:].tolist():
+        result[row] = check_one(encoded[row], automaton)
+    return result
+
+# Проверка одной строки (str или bytes в UTF-8) через process_input
+def check_one(string, automaton):
+    if isinstance(string, bytes):
+        string = string.decode('utf-8', 'replace')
+    return process_input(string, *automaton)
+
 def process_input(input_string, states, initial_state, final_states, transition_function):
     current_state = initial_state
     for char in input_string:
+        # Переход по самому символу, если он есть
+        if (current_state, char) in transition_function:
+            current_state = transition_function[(current_state, char)]
+            continue
+
         # Определяем тип символа: буква, цифра или подчеркивание
-        if char in letters:
-            char_type = 'letter'
-        elif char in digits:
-            char_type = 'digit'
-        elif char == '_':
-            char_type = '_'
-        else:
+        char_type = char_type_of(char)
+        if char_type is None:
             return False  # Если символ не подходит, сразу возвращаем False
 
         # Переход к новому состоянию
@@ -43,6 +144,90 @@ def process_input(input_string, states, initial_state, final_states, transition_
             return False
     return current_state in final_states
 
+# Поиск в потоке (файле) всех максимальных совпадений автомата: самых длинных,
+# без перекрытий, слева направо. Возвращает (начало, конец, текст); для байтового
+# потока смещения в байтах. Поток читается кусками по chunk_size.
+# Пары (состояние, смещение), из которых принятие не достигнуто, запоминаются
+# (как у Репса): следующий кандидат, придя в такую пару, сразу заканчивается,
+# поэтому каждая пара проходится один раз и поиск линеен по длине потока.
+# Память не постоянна: текущий кусок, незаконченный кандидат и отказы правее
+# начала кандидата (на смещение — не больше числа состояний); всё это ограничено
+# длиной самого длинного просмотренного кандидата, а не размером потока
+def find_all(stream, automaton=None, chunk_size=1 << 16):
+    states, initial_state, final_states, transition_function = automaton or create_automaton()
+    char_types = {'_': '_'}
+    char_types.update(dict.fromkeys(letters, 'letter'))
+    char_types.update(dict.fromkeys(digits, 'digit'))
+    # Переходы по самим символам: rows[состояние][символ]
+    rows = {state: {} for state in states}
+    for char, char_type in char_types.items():
+        for state in states:
+            if (state, char_type) in transition_function:
+                rows[state][char] = transition_function[(state, char_type)]
+    for (state, symbol), target in transition_function.items():
+        if symbol not in CHAR_TYPES:
+            rows[state][symbol] = target
+
+    failed = {}  # Смещение в потоке -> состояния, из которых принятие недостижимо
+    pruned = 0  # Отказы левее этого смещения уже забыты
+    buffer = ''
+    base = 0  # Смещение buffer[0] в потоке
+    begin = index = 0  # Начало кандидата и следующий символ в buffer
+    end = None  # Конец самого длинного принятого префикса кандидата
+    accepted = None  # Состояние автомата в конце этого префикса
+    state = initial_state
+    while True:
+        chunk = stream.read(chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode('latin-1')  # Байт — символ, смещения совпадают
+        buffer = buffer[begin:] + chunk
+        base += begin
+        index -= begin
+        if end is not None:
+            end -= begin
+        begin = 0
+        while True:
+            if index < len(buffer):
+                target = rows[state].get(buffer[index])
+                if target in final_states:
+                    state = accepted = target
+                    index += 1
+                    end = index
+                    continue
+                # Отказы бывают только в неконечных состояниях
+                if target is not None and target not in failed.get(base + index + 1, ()):
+                    state = target
+                    index += 1
+                    continue
+            elif chunk:
+                break  # Кандидат может продолжиться в следующем куске
+            # Кандидат закончился: пары после последнего принятия — отказы,
+            # они находятся повторным проходом от этого принятия
+            offset = begin if end is None else end
+            if offset < index:
+                state = initial_state if end is None else accepted
+                while offset < index:
+                    state = rows[state][buffer[offset]]
+                    offset += 1
+                    failed.setdefault(base + offset, set()).add(state)
+            # Выдаём принятый префикс или сдвигаемся на символ
+            if end is not None:
+                yield base + begin, base + end, buffer[begin:end]
+                begin = end
+            else:
+                begin += 1
+            if failed:
+                while pruned <= base + begin:
+                    failed.pop(pruned, None)
+                    pruned += 1
+            else:
+                pruned = base + begin
+            if not chunk and begin >= len(buffer):
+                return
+            index = begin
+            end = None
+            state = initial_state
+
 if __name__ == "__main__":
     states, initial_state, final_states, transition_function = create_automaton()
     input_string = input("Введите строку для анализа: ")
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from automata import EPSILON, NFA
+
+# Компилятор регулярных выражений в ДКА вида create_automaton() из main.py.
+# Алфавит — типы символов process_input: \a — буква, \d — цифра, '_' — подчёркивание,
+# \w — любой из них. Поддерживаются | * + ? скобки и классы [...], например
+# идентификатор: \a\w*
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__dfacache__')
+CACHE_VERSION = 1  # Меняется при изменении формата файла или построения автомата
+ESCAPES = {
+    'a': {'letter'},
+    'd': {'digit'},
+    'w': {'letter', 'digit', '_'},
+}
+
+
+# Разбор выражения с построением НКА Томпсона
+class RegexParser:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.pos = 0
+        self.transitions = {}
+        self.count = 0
+
+    def parse(self):
+        start, end = self.parse_alternation()
+        if self.pos != len(self.pattern):
+            raise ValueError(f"Unexpected '{self.pattern[self.pos]}' in {self.pattern!r}")
+        return NFA(range(self.count), start, {end}, self.transitions)
+
+    def state(self):
+        self.count += 1
+        return self.count - 1
+
+    def edge(self, source, symbol, target):
+        self.transitions.setdefault((source, symbol), set()).add(target)
+
+    def peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def parse_alternation(self):
+        start, end = self.state(), self.state()
+        while True:
+            branch_start, branch_end = self.parse_concatenation()
+            self.edge(start, EPSILON, branch_start)
+            self.edge(branch_end, EPSILON, end)
+            if self.peek() != '|':
+                return start, end
+            self.pos += 1
+
+    def parse_concatenation(self):
+        start = end = self.state()
+        while self.peek() not in (None, '|', ')'):
+            piece_start, piece_end = self.parse_repetition()
+            self.edge(end, EPSILON, piece_start)
+            end = piece_end
+        return start, end
+
+    def parse_repetition(self):
+        start, end = self.parse_atom()
+        while self.peek() in ('*', '+', '?'):
+            operator = self.pattern[self.pos]
+            self.pos += 1
+            outer_start, outer_end = self.state(), self.state()
+            self.edge(outer_start, EPSILON, start)
+            self.edge(end, EPSILON, outer_end)
+            if operator != '+':
+                self.edge(outer_start, EPSILON, outer_end)
+            if operator != '?':
+                self.edge(end, EPSILON, start)
+            start, end = outer_start, outer_end
+        return start, end
+
+    def parse_atom(self):
+        if self.peek() == '(':
+            self.pos += 1
+            start, end = self.parse_alternation()
+            if self.peek() != ')':
+                raise ValueError(f"Missing ')' in {self.pattern!r}")
+            self.pos += 1
+            return start, end
+        if self.peek() == '[':
+            self.pos += 1
+            symbols = set()
+            while self.peek() != ']':
+                if self.peek() is None:
+                    raise ValueError(f"Missing ']' in {self.pattern!r}")
+                symbols |= self.parse_symbol()
+            self.pos += 1
+        else:
+            symbols = self.parse_symbol()
+        start, end = self.state(), self.state()
+        for symbol in symbols:
+            self.edge(start, symbol, end)
+        return start, end
+
+    def parse_symbol(self):
+        char = self.peek()
+        if char is None or char in '*+?':
+            raise ValueError(f"Missing operand at {self.pos} in {self.pattern!r}")
+        self.pos += 1
+        if char == '_':
+            return {'_'}
+        if char == '\\' and self.peek() in ESCAPES:
+            self.pos += 1
+            return ESCAPES[self.pattern[self.pos - 1]]
+        raise ValueError(f"Unsupported symbol '{char}' in {self.pattern!r}")
+
+
+def cache_path(pattern):
+    key = hashlib.sha256(f"{CACHE_VERSION}:{pattern}".encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, key + '.json')
+
+
+def load_cached(pattern):
+    try:
+        with open(cache_path(pattern), encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if data.get('pattern') != pattern:
+        return None
+    transition_function = {(state, symbol): target for state, symbol, target in data['transitions']}
+    return set(data['states']), data['initial_state'], set(data['final_states']), transition_function
+
+
+# Запись через временный файл, чтобы параллельно стартующие процессы
+# не прочитали недописанный автомат
+def store_cached(pattern, automaton):
+    states, initial_state, final_states, transition_function = automaton
+    data = {
+        'pattern': pattern,
+        'states': sorted(states),
+        'initial_state': initial_state,
+        'final_states': sorted(final_states),
+        'transitions': [[state, symbol, target] for (state, symbol), target in transition_function.items()],
+    }
+    path = cache_path(pattern)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temporary, path)
+    except OSError:
+        pass  # Без кэша на диске автомат просто построится заново при следующем запуске
+
+
+# Минимальный ДКА для выражения в виде (states, initial_state, final_states,
+# transition_function). Результат общий для всех вызовов с тем же выражением,
+# изменять его нельзя
+@lru_cache(maxsize=512)
+def compile_regex(pattern, use_disk=True):
+    automaton = load_cached(pattern) if use_disk else None
+    if automaton is None:
+        automaton = RegexParser(pattern).parse().to_dfa().minimize().as_tuple()
+        if use_disk:
+            store_cached(pattern, automaton)
+    return automaton
+
+
+if __name__ == "__main__":
+    from main import process_input
+    pattern = input("Регулярное выражение (например, \\a\\w*): ")
+    automaton = compile_regex(pattern)
+    print(f"Минимальный ДКА: {len(automaton[0])} состояний")
+    input_string = input("Введите строку для анализа: ")
+    if process_input(input_string, *automaton):
+        print("Строка принята")
+    else:
+        print("Строка не принята")
@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import compress
+from main import accept_many, create_automaton
+from regexdfa import compile_regex
+
+# Пакетная проверка строк автоматом: файл (или stdin) режется на блоки целых строк,
+# блоки проверяются в пуле процессов. Результат — число принятых и отклонённых
+# строк и сами отклонённые строки
+worker_automaton = None  # Автомат в процессе пула (строится один раз при запуске)
+
+
+def init_worker(pattern):
+    global worker_automaton
+    worker_automaton = compile_regex(pattern) if pattern else create_automaton()
+
+
+# Проверка блока: (принято, отклонено, отклонённые строки через '\n')
+def check_block(block):
+    lines = block.splitlines()
+    rejected = [not result for result in list(accept_many(lines, worker_automaton))]
+    rejected_count = sum(rejected)
+    return len(lines) - rejected_count, rejected_count, b'\n'.join(compress(lines, rejected))
+
+
+# Блоки по block_size байт, обрезанные по последнему переводу строки
+def read_blocks(file, block_size):
+    rest = b''
+    while True:
+        data = file.read(block_size)
+        if not data:
+            if rest:
+                yield rest
+            return
+        cut = data.rfind(b'\n') + 1
+        if cut:
+            yield rest + data[:cut]
+            rest = data[cut:]
+        else:
+            rest += data
+
+
+# ordered=False выводит отклонённые строки в порядке готовности блоков, без
+# буфера для восстановления порядка. В обработке одновременно не больше
+# 2 * workers блоков, поэтому память не зависит от размера входа
+def validate(file, output, workers=None, block_size=1 << 22, ordered=False, pattern=None):
+    workers = workers or os.cpu_count() or 1
+    accepted = rejected = 0
+    pending = deque()
+
+    def collect(future):
+        nonlocal accepted, rejected
+        block_accepted, block_rejected, lines = future.result()
+        accepted += block_accepted
+        rejected += block_rejected
+        if block_rejected:
+            output.write(lines + b'\n')
+
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(pattern,)) as pool:
+        for block in read_blocks(file, block_size):
+            pending.append(pool.submit(check_block, block))
+            while len(pending) >= 2 * workers:
+                if ordered:
+                    collect(pending.popleft())
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        collect(future)
+        while pending:
+            collect(pending.popleft())
+    return accepted, rejected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетная проверка строк конечным автоматом")
+    parser.add_argument('input', nargs='?', default='-', help="файл со строками (по умолчанию stdin)")
+    parser.add_argument('--rejected', default='-', help="куда записать отклонённые строки (по умолчанию stdout)")
+    parser.add_argument('--workers', type=int, default=None, help="число процессов")
+    parser.add_argument('--block-size', type=int, default=1 << 22, help="размер блока в байтах")
+    parser.add_argument('--ordered', action='store_true', help="отклонённые строки в порядке входа")
+    parser.add_argument('--regex', default=None, help="проверять выражением (см. regexdfa.py), а не create_automaton()")
+    arguments = parser.parse_args()
+    source = sys.stdin.buffer if arguments.input == '-' else open(arguments.input, 'rb')
+    target = sys.stdout.buffer if arguments.rejected == '-' else open(arguments.rejected, 'wb')
+    try:
+        accepted, rejected = validate(source, target, arguments.workers, arguments.block_size,
+                                      arguments.ordered, arguments.regex)
+    finally:
+        target.flush()
+        if source is not sys.stdin.buffer:
+            source.close()
+        if target is not sys.stdout.buffer:
+            target.close()
+    print(f"Принято: {accepted}, отклонено: {rejected}", file=sys.stderr)
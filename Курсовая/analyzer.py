@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox
 from lex import Lexer
-from syntax import Syntax
+from pipeline import Pipeline
 from semantic import Semantic
+from syntax import Syntax
 from prettytable import PrettyTable
 
 # Исходный код
@@ -18,10 +19,13 @@ $ flag;
 }
 '''
 
+# Результаты анализа по тексту: повторное нажатие кнопки для того же текста
+# ничего не пересчитывает, три кнопки разбирают текст один раз
+pipeline = Pipeline()
+
 def run_lexical_analysis():
     try:
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
+        tokens = pipeline.tokens(code)
 
         table = PrettyTable()
         table.field_names = ["Тип токена", "Токен"]
@@ -37,24 +41,22 @@ def run_lexical_analysis():
 
 def run_syntax_analysis():
     try:
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-
-        parser = Syntax(tokens)
-        parser.parse_program()
+        errors = pipeline.errors(code)
 
         output_text.delete(1.0, tk.END)
-        output_text.insert(tk.END, "Синтаксический анализ - OK\n")
+        if not errors:
+            output_text.insert(tk.END, "Синтаксический анализ - OK\n")
+            return
+        # Все ошибки за один разбор
+        output_text.insert(tk.END, f"Синтаксических ошибок: {len(errors)}\n")
+        for error in errors:
+            output_text.insert(tk.END, f"{error}\n")
     except SyntaxError as e:
         messagebox.showerror("Ошибка", f"Ошибка синтаксического анализа: {e}")
 
 def run_semantic_analysis():
     try:
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-
-        analyzer = Semantic(tokens)
-        result = analyzer.analyze_tokens()
+        result = pipeline.semantic(code)
 
         # Выводим результаты семантического анализа
         output_text.delete(1.0, tk.END)
@@ -62,13 +64,11 @@ def run_semantic_analysis():
         output_text.insert(tk.END, result)
 
         # Преобразование выражений в ОПН
-        # Пример: собираем токены для одного выражения
-        expression_tokens = [
-            ('ID', 'sum'), ('ADD_OP', '+'), ('ID', 'i'),
-        ]
+        # Пример: дерево одного выражения строит Syntax
+        expression = Syntax(Lexer("sum + i").tokenize()).parse_expression()
 
         # Получаем строку ОПН
-        rpn = analyzer.to_rpn_expression(expression_tokens)
+        rpn = Semantic().to_rpn_expression(expression)
 
         # Добавляем ОПН в текстовый блок
         output_text.insert(tk.END, "\nОбратная польская нотация (ОПН):\n")
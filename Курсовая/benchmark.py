@@ -0,0 +1,144 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from lex import Lexer
+from nodes import Node, Assign, Binary, Unary
+from syntax import Syntax
+from folding import fold_constants
+from semantic import Semantic
+from generator import ProgramGenerator
+
+SIZES = {'K': 1_000, 'M': 1_000_000, 'G': 1_000_000_000}
+
+
+# Размер вида 1K, 1M, 100M или просто число символов
+def parse_size(text):
+    text = text.strip().upper()
+    if text[-1:] in SIZES:
+        return int(float(text[:-1]) * SIZES[text[-1]])
+    return int(text)
+
+
+# Выражения всех присваиваний программы (и во вложенных операторах), обход без рекурсии
+def assignment_values(program):
+    values = []
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Assign):
+            values.append(node.value)
+        elif not isinstance(node, (Binary, Unary)):
+            for value in node.fields():
+                if isinstance(value, Node):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, Node))
+    return values
+
+
+# Число узлов дерева выражения: операнды и операции (лексемы без скобок)
+def expression_size(node):
+    size = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        size += 1
+        if isinstance(node, Binary):
+            stack.extend((node.left, node.right))
+        elif isinstance(node, Unary):
+            stack.append(node.operand)
+    return size
+
+
+def analyze(tokens, program):
+    result = Semantic(tokens).analyze(program)
+    if not result.endswith("успешно"):
+        raise RuntimeError(result)
+    return result
+
+
+def convert_expressions(values):
+    analyzer = Semantic()
+    for value in values:
+        analyzer.to_rpn_expression(value)
+
+
+# Время работы и пик памяти этапа. Пик меряется отдельным запуском под
+# tracemalloc, чтобы трассировка не искажала время
+def measure(stage):
+    start = time.perf_counter()
+    stage()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    stage()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_size(size, depth, seed):
+    generator = ProgramGenerator(depth=depth, seed=seed)
+    text = generator.generate(size)
+    tokens = Lexer(text).tokenize_stream()
+    program = Syntax(tokens).parse_program()
+    values = assignment_values(program)
+    expression_tokens = sum(map(expression_size, values))
+
+    # Этап, его функция, число обработанных лексем и операторов
+    # (для ОПН — присваиваний, выражения которых переведены)
+    stages = [
+        ("Lexer", lambda: Lexer(text).tokenize_stream(), len(tokens), generator.statements),
+        ("Syntax.parse_program", lambda: Syntax(tokens).parse_program(), len(tokens), generator.statements),
+        ("Syntax.check_program", lambda: Syntax(tokens).check_program(), len(tokens), generator.statements),
+        ("Semantic.analyze", lambda: analyze(tokens, program), len(tokens), generator.statements),
+        ("fold_constants", lambda: fold_constants(program), len(tokens), generator.statements),
+        ("to_rpn_expression", lambda: convert_expressions(values), expression_tokens, len(values)),
+    ]
+    results = []
+    for name, stage, token_count, statement_count in stages:
+        elapsed, peak = measure(stage)
+        results.append({
+            "stage": name,
+            "seconds": elapsed,
+            "tokens": token_count,
+            "statements": statement_count,
+            "tokens_per_sec": token_count / elapsed if elapsed else None,
+            "statements_per_sec": statement_count / elapsed if elapsed else None,
+            "peak_memory_bytes": peak,
+        })
+    return {"size": len(text), "depth": depth, "seed": seed, "stages": results}
+
+
+def run_benchmark(sizes, depth=3, seed=0, output="benchmark_results.json"):
+    report = {
+        "date": datetime.now().isoformat(timespec='seconds'),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [],
+    }
+    for size in sizes:
+        run = run_size(size, depth, seed)
+        report["runs"].append(run)
+        print(f"Размер программы: {run['size']} символов")
+        for stage in run["stages"]:
+            print(f"{stage['stage']:>24}: {stage['tokens_per_sec']:14,.0f} лексем/с, "
+                  f"{stage['statements_per_sec']:12,.0f} операторов/с, "
+                  f"пик {stage['peak_memory_bytes'] / 2 ** 20:9.1f} МБ")
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {output}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер скорости и памяти этапов анализа")
+    parser.add_argument('sizes', nargs='*', default=['1K', '1M', '100M'], help="размеры программ: 1K, 1M, 100M")
+    parser.add_argument('--depth', type=int, default=3, help="наибольшая вложенность операторов")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default="benchmark_results.json", help="файл JSON с результатами")
+    arguments = parser.parse_args()
+    run_benchmark([parse_size(size) for size in arguments.sizes], arguments.depth, arguments.seed, arguments.output)
@@ -0,0 +1,131 @@
+import math
+from nodes import Node, Binary, Unary, Number, Boolean
+
+ARITHMETIC = {
+    '+': lambda left, right: left + right,
+    '-': lambda left, right: left - right,
+    '*': lambda left, right: left * right,
+}
+COMPARISONS = {
+    '<>': lambda left, right: left != right,
+    '=': lambda left, right: left == right,
+    '<': lambda left, right: left < right,
+    '<=': lambda left, right: left <= right,
+    '>': lambda left, right: left > right,
+    '>=': lambda left, right: left >= right,
+}
+
+
+# Узлы-потомки: поля-узлы и узлы в полях-списках, по порядку полей
+def children(node):
+    result = []
+    for value in node.fields():
+        if isinstance(value, Node):
+            result.append(value)
+        elif isinstance(value, list):
+            result.extend(item for item in value if isinstance(item, Node))
+    return result
+
+
+# Свёртка констант в дереве разбора (nodes.py): операции над литералами
+# вычисляются при анализе, значения чисел берутся из узлов Number (Syntax уже
+# перевёл их в int или float). Сворачиваются только операции с допустимыми
+# типами операндов, как в Semantic: арифметика и сравнения над числами,
+# and/or/not над логическими значениями. Деление на ноль, деление целых с
+# остатком (результат язык не определяет) и переполнение действительных чисел
+# не сворачиваются. Обход без рекурсии; поддеревья без изменений не копируются,
+# поэтому исходное дерево остаётся прежним
+class ConstantFolder:
+    def __init__(self):
+        # Свёрнутые выражения: (новый узел, число убранных операций); в отчёт
+        # попадают только наибольшие — записи операндов заменяет запись операции
+        self.folded = []
+
+    def fold(self, root):
+        stack = [(root, None)]  # (узел, его потомки — когда они уже обойдены)
+        done = []  # Результаты для узлов, обход которых закончен
+        while stack:
+            node, old_children = stack.pop()
+            if old_children is None:
+                old_children = children(node)
+                stack.append((node, old_children))
+                stack.extend((child, None) for child in reversed(old_children))
+                continue
+            if old_children:
+                new_children = done[len(done) - len(old_children):]
+                del done[len(done) - len(old_children):]
+                node = self.rebuild(node, old_children, new_children)
+            done.append(node)
+        return done[0]
+
+    # Узел с новыми потомками (тот же узел, если потомки не изменились);
+    # операция над константами заменяется её значением
+    def rebuild(self, node, old_children, new_children):
+        if any(new is not old for new, old in zip(new_children, old_children)):
+            replacements = iter(new_children)
+            values = []
+            for value in node.fields():
+                if isinstance(value, Node):
+                    value = next(replacements)
+                elif isinstance(value, list):
+                    value = [next(replacements) if isinstance(item, Node) else item for item in value]
+                values.append(value)
+            node = type(node)(node.position, *values)
+        if isinstance(node, Binary):
+            value = self.binary_value(node.operator, node.left, node.right)
+        elif isinstance(node, Unary):
+            value = not node.operand.value if type(node.operand) is Boolean else None
+        else:
+            return node
+        if value is None:
+            return node
+        operations = 1
+        for operand in (node.operand,) if isinstance(node, Unary) else (node.right, node.left):
+            if self.folded and self.folded[-1][0] is operand:
+                operations += self.folded.pop()[1]
+        if isinstance(value, bool):
+            result = Boolean(node.position, value)
+        else:
+            result = Number(node.position, value, None)
+        self.folded.append((result, operations))
+        return result
+
+    # Значение операции над константами или None, если её нельзя свернуть
+    def binary_value(self, operator, left, right):
+        if type(left) is Boolean and type(right) is Boolean:
+            if operator == 'and':
+                return left.value and right.value
+            if operator == 'or':
+                return left.value or right.value
+            return None
+        if type(left) is not Number or type(right) is not Number:
+            return None
+        try:
+            if operator in COMPARISONS:
+                return COMPARISONS[operator](left.value, right.value)
+            if operator in ARITHMETIC:
+                value = ARITHMETIC[operator](left.value, right.value)
+            elif operator == '/' and right.value:
+                if isinstance(left.value, int) and isinstance(right.value, int):
+                    if left.value % right.value:
+                        return None
+                    value = left.value // right.value
+                else:
+                    value = left.value / right.value
+            else:
+                return None
+        except OverflowError:
+            return None  # Целое слишком велико для действительного числа
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+
+    # Отчёт о свёртке: (номер первой лексемы выражения, значение, убрано операций)
+    def report(self):
+        return [(node.position, node.value, operations) for node, operations in self.folded]
+
+
+# Дерево со свёрнутыми константами и отчёт о свёртке (ConstantFolder.report)
+def fold_constants(node):
+    folder = ConstantFolder()
+    return folder.fold(node), folder.report()
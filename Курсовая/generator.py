@@ -0,0 +1,130 @@
+import random
+
+# Числа во всех форматах, которые распознаёт лексер
+NUMBER_FORMATS = [
+    lambda r: r.choice(['0b', '0B']) + ''.join(r.choice('01') for _ in range(r.randint(1, 8))),
+    lambda r: r.choice(['0o', '0O']) + ''.join(r.choice('01234567') for _ in range(r.randint(1, 4))),
+    lambda r: r.choice(['0h', '0H']) + ''.join(r.choice('0123456789ABCDEFabcdef') for _ in range(r.randint(1, 4))),
+    lambda r: str(r.randint(0, 100000)),
+    lambda r: str(r.randint(0, 1000)) + r.choice('Dd'),
+    lambda r: f"{r.randint(0, 999)}.{r.randint(0, 999)}",
+    lambda r: f"{r.randint(0, 99)}.{r.randint(0, 99)}{r.choice('Ee')}{r.choice(['', '+', '-'])}{r.randint(1, 12)}",
+    lambda r: f"{r.randint(1, 9)}{r.choice('Ee')}{r.randint(1, 12)}",
+]
+
+ADD_OPS = ['+', '-']
+MUL_OPS = ['*', '/']
+REL_OPS = ['<>', '=', '<', '<=', '>', '>=']
+COMMENTS = ['/* пересчёт */', '/* loop body */', '/* многострочный\n   комментарий */', '/**/']
+STRINGS = ["'result'", "'итог'", "'x = '", "''"]
+
+
+# Случайная программа по грамматике из README.md. Порождаются только конструкции,
+# которые проходят все три этапа анализа (Lexer, Syntax, Semantic): например,
+# переменным присваиваются значения их типа, условия — логические выражения.
+# Составной оператор стоит только на верхнем уровне
+class ProgramGenerator:
+    def __init__(self, depth=3, seed=0, variables=20):
+        self.depth = depth  # Наибольшая вложенность операторов и скобок в выражениях
+        self.random = random.Random(seed)
+        self.integers = [f"n{i}" for i in range(variables)]
+        self.reals = [f"r{i}" for i in range(max(1, variables // 4))]
+        self.booleans = [f"f{i}" for i in range(max(1, variables // 4))]
+        self.statements = 0  # Сколько операторов (с вложенными) породил generate
+
+    # Программа не короче size символов
+    def generate(self, size):
+        self.statements = 0
+        parts = ["{\n"]
+        parts.append(self.declaration('%', self.integers))
+        parts.append(self.declaration('!', self.reals))
+        parts.append(self.declaration('$', self.booleans))
+        length = sum(map(len, parts))
+        while length < size:
+            if self.random.random() < 0.1:
+                part = self.random.choice(COMMENTS) + "\n"
+            else:
+                part = self.top_statement() + ";\n"
+            parts.append(part)
+            length += len(part)
+        parts.append("}\n")
+        return ''.join(parts)
+
+    def declaration(self, kind, names):
+        return f"{kind} {', '.join(names)};\n"
+
+    def top_statement(self):
+        if self.random.random() < 0.15:
+            self.statements += 1
+            count = self.random.randint(2, 4)
+            body = [self.statement(self.depth) for _ in range(count)]
+            separators = [self.random.choice([' : ', '\n    ']) for _ in range(count - 1)]
+            return "[" + ''.join(s + sep for s, sep in zip(body, separators)) + body[-1] + "]"
+        return self.statement(self.depth)
+
+    def statement(self, depth):
+        self.statements += 1
+        choices = [self.assignment, self.assignment, self.assignment, self.input, self.output]
+        if depth > 0:
+            choices += [self.conditional, self.while_loop, self.for_loop]
+        return self.random.choice(choices)(depth)
+
+    def assignment(self, depth):
+        roll = self.random.random()
+        if roll < 0.7:
+            return f"{self.random.choice(self.integers)} as {self.expression(depth)}"
+        if roll < 0.85:
+            return f"{self.random.choice(self.booleans)} as {self.condition(depth)}"
+        return f"{self.random.choice(self.reals)} as {self.random.choice(self.reals)}"
+
+    def conditional(self, depth):
+        text = f"if ({self.condition(depth)}) then {self.statement(depth - 1)}"
+        if self.random.random() < 0.4:
+            text += f" else {self.statement(depth - 1)}"
+        return text
+
+    def while_loop(self, depth):
+        return f"while ({self.condition(depth)}) do {self.statement(depth - 1)}"
+
+    def for_loop(self, depth):
+        start = self.random.choice(self.integers)
+        return f"for {start} as {self.expression(depth)} to {self.expression(depth)} do {self.statement(depth - 1)}"
+
+    def input(self, depth):
+        names = self.random.sample(self.integers + self.reals + self.booleans, self.random.randint(1, 3))
+        return f"read({', '.join(names)})"
+
+    def output(self, depth):
+        values = []
+        for _ in range(self.random.randint(1, 3)):
+            if self.random.random() < 0.3:
+                values.append(self.random.choice(STRINGS))
+            else:
+                values.append(self.expression(depth, simple_start=True))
+        return f"write({', '.join(values)})"
+
+    # Логическое выражение: сравнение, логическая переменная или константа
+    def condition(self, depth):
+        roll = self.random.random()
+        if roll < 0.8:
+            operator = self.random.choice(REL_OPS)
+            return f"{self.random.choice(self.integers)} {operator} {self.expression(depth)}"
+        if roll < 0.95:
+            return self.random.choice(self.booleans)
+        return self.random.choice(['true', 'false'])
+
+    # Числовое выражение с операциями из operators; simple_start — без скобки в начале
+    def expression(self, depth, operators=ADD_OPS + MUL_OPS, simple_start=False):
+        parts = [self.operand(depth, simple_start)]
+        for _ in range(self.random.randint(0, 3)):
+            parts.append(self.random.choice(operators))
+            parts.append(self.operand(depth))
+        return ' '.join(parts)
+
+    def operand(self, depth, simple=False):
+        roll = self.random.random()
+        if not simple and depth > 0 and roll < 0.15:
+            return f"({self.expression(depth - 1)})"
+        if roll < 0.6:
+            return self.random.choice(self.integers)
+        return self.random.choice(NUMBER_FORMATS)(self.random)
@@ -0,0 +1,981 @@
+import mmap
+import os
+import re
+import string
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from sys import intern
+import lextable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Векторный режим (scan_vectorized) недоступен
+
+
+# Индекс начал строк: строится один раз массовым поиском переводов строки,
+# смещение переводится в (строка, столбец) двоичным поиском
+class LineIndex:
+    def __init__(self, source):
+        self.source = source
+        newline = '\n' if isinstance(source, str) else b'\n'
+        self.starts = array('q', [0])
+        self.starts.extend(match.end() for match in re.finditer(newline, source))
+
+    # Строка и столбец (с единицы) для смещения offset
+    def position(self, offset):
+        line = bisect_right(self.starts, offset)
+        prefix = self.source[self.starts[line - 1]:offset]
+        if not isinstance(prefix, str):
+            prefix = prefix.decode('utf-8', 'replace')  # Смещения в байтах
+        return line, len(prefix) + 1
+
+
+# Компактный поток лексем: коды типов, смещения и длины лексем хранятся в массивах,
+# значения вырезаются из исходного текста только по запросу. На лексему — 7 байт:
+# код типа (1), смещение (4, пока текст короче 1 ГиБ; со знаком, потому что
+# отложенный сдвиг, см. splice, может сделать хранимое смещение отрицательным)
+# и длина (2; длины от LONG и больше лежат в словаре long_lengths по номеру лексемы).
+# Индексация возвращает такие же кортежи (тип, значение), как Lexer.tokenize;
+# идентификаторы, как и у Lexer, интернируются (sys.intern): одинаковые имена —
+# один объект строки, поиск в таблице символов сравнивает указатели
+class TokenStream:
+    KINDS = ['ID', 'KEYWORD', 'TYPE', 'NUMBER', 'STRING', 'REL_OP', 'ADD_OP', 'MUL_OP', 'DELIMITER', 'UNKNOWN', 'ERROR']
+    CODES = {kind: code for code, kind in enumerate(KINDS)}
+    LONG = 0xFFFF  # Длина в lengths для длинных лексем
+
+    def __init__(self, source):
+        self.source = source
+        self.kinds = array('B')
+        self.offsets = array('i' if len(source) < 1 << 30 else 'q')
+        self.lengths = array('H')
+        self.long_lengths = {}  # Номер лексемы -> длина, если она не меньше LONG
+        # Отложенный сдвиг после правок (см. splice): к смещениям лексем
+        # с номера shift_from прибавляется shift
+        self.shift_from = 0
+        self.shift = 0
+        self.lines = None  # LineIndex, строится при первом запросе позиции
+
+    def append(self, kind, offset, length):
+        if length >= self.LONG:
+            self.long_lengths[len(self.kinds)] = length
+            length = self.LONG
+        self.kinds.append(self.CODES[kind])
+        self.offsets.append(offset)
+        self.lengths.append(length)
+
+    def kind(self, index):
+        return self.KINDS[self.kinds[index]]
+
+    def offset(self, index):
+        if index < 0:
+            index += len(self)
+        if index >= self.shift_from:
+            return self.offsets[index] + self.shift
+        return self.offsets[index]
+
+    def length(self, index):
+        length = self.lengths[index]
+        if length == self.LONG:
+            return self.long_lengths[index if index >= 0 else index + len(self)]
+        return length
+
+    # Строка и столбец начала лексемы; для index == len(self) — конец текста
+    def position(self, index):
+        if self.lines is None:
+            self.lines = LineIndex(self.source)
+        offset = len(self.source) if index == len(self) else self.offset(index)
+        return self.lines.position(offset)
+
+    # Номер первой лексемы, начинающейся не раньше position
+    def find(self, position):
+        index = bisect_left(self.offsets, position, 0, self.shift_from)
+        if index == self.shift_from:
+            index = bisect_left(self.offsets, position - self.shift, self.shift_from)
+        return index
+
+    # Замена лексем [start:stop) лексемами other (смещения уже новые);
+    # смещения следующих лексем сдвигаются на delta лениво, поэтому стоимость
+    # правки пропорциональна её размеру и расстоянию до предыдущей правки
+    def splice(self, start, stop, other, delta):
+        if self.shift_from < start:
+            self.add_to_offsets(self.shift_from, start, self.shift)
+        elif self.shift_from > stop:
+            self.add_to_offsets(stop, self.shift_from, -self.shift)
+        if self.long_lengths or other.long_lengths:
+            moved = len(other) - (stop - start)
+            long_lengths = {index: length for index, length in self.long_lengths.items() if index < start}
+            long_lengths.update((start + index, length) for index, length in other.long_lengths.items())
+            long_lengths.update((index + moved, length) for index, length in self.long_lengths.items() if index >= stop)
+            self.long_lengths = long_lengths
+        offsets = other.offsets
+        if offsets.typecode != self.offsets.typecode:
+            # Текст вырос до 1 ГиБ или был больше: смещения расширяются до 8 байт
+            if offsets.itemsize > self.offsets.itemsize:
+                self.offsets = array(offsets.typecode, self.offsets)
+            else:
+                offsets = array(self.offsets.typecode, offsets)
+        self.kinds[start:stop] = other.kinds
+        self.offsets[start:stop] = offsets
+        self.lengths[start:stop] = other.lengths
+        self.shift_from = start + len(other)
+        self.shift += delta
+
+    def add_to_offsets(self, start, stop, delta):
+        if delta:
+            self.offsets[start:stop] = array(self.offsets.typecode, [offset + delta for offset in self.offsets[start:stop]])
+
+    # Независимая копия потока (буферы копируются, текст и индекс строк общие)
+    def copy(self):
+        stream = TokenStream(self.source)
+        stream.kinds = array('B', self.kinds)
+        stream.offsets = array(self.offsets.typecode, self.offsets)
+        stream.lengths = array('H', self.lengths)
+        stream.long_lengths = dict(self.long_lengths)
+        stream.shift_from = self.shift_from
+        stream.shift = self.shift
+        stream.lines = self.lines
+        return stream
+
+    def value(self, index):
+        offset = self.offset(index)
+        lexeme = self.source[offset:offset + self.length(index)]
+        if not isinstance(lexeme, str):
+            lexeme = lexeme.decode('utf-8')  # Файл, отображённый в память
+        kind = self.KINDS[self.kinds[index]]
+        if kind == 'ID':
+            return intern(lexeme)
+        if kind == 'ERROR':
+            return f"Unexpected character: {lexeme or None}"
+        if kind == 'STRING' and (len(lexeme) == 1 or lexeme[-1] != "'"):
+            return lexeme + "'"
+        return lexeme
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.kind(index), self.value(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class Lexer:
+    # Состояния автомата
+    class LexerState(Enum):
+        H = "H"  # Начальное состояние
+        ID = "ID"  # Идентификаторы
+        NUM = "NUM"  # Числа
+        COM = "COM"  # Комментарии
+        ALE = "ALE"  # Операции отношения
+        NEQ = "NEQ"  # Неравенство
+        DELIM = "DELIM"  # Разделители
+        STR = "STR"  # Строковые литералы
+        ERROR = "ERROR"  # Состояние ошибки
+        END = "END"  # Конечное состояние
+
+    # Кэш кодов классов лексем (TokenStream.CODES) на время одного разбора (быстрый режим);
+    # None — неизвестный символ
+    class TokenKinds(dict):
+        def __init__(self, known, first_kinds):
+            super().__init__((value, TokenStream.CODES[kind]) for value, kind in known.items())
+            self.first_kinds = first_kinds
+
+        def __missing__(self, value):
+            kind = self.first_kinds.get(value[0])
+            code = self[value] = TokenStream.CODES[kind] if kind is not None else None
+            return code
+
+    # Кэш готовых лексем (тип, значение) на время одного разбора (быстрый режим):
+    # одинаковые лексемы — один кортеж, идентификатор интернируется при первой встрече.
+    # Пустых значений (комментариев) в кэш не попадает
+    class TokenCache(dict):
+        def __init__(self, known, first_kinds):
+            super().__init__((value, (kind, value)) for value, kind in known.items())
+            self.first_kinds = first_kinds
+            self.irregular = False  # Встретились ошибки или незакрытая строка
+
+        def __missing__(self, value):
+            kind = self.first_kinds.get(value[0])
+            if kind is None or (kind == 'STRING' and (len(value) == 1 or value[-1] != "'")):
+                self.irregular = True
+            token = self[value] = (kind, intern(value) if kind == 'ID' else value)
+            return token
+
+    # Кэш лексем (тип, значение) по ключу для векторного режима. Ключ лексемы до 8 байт —
+    # её байты, упакованные в целое (последний байт лексемы не нулевой, поэтому ключ
+    # однозначен), более длинной — сами байты
+    class PackedTokens(dict):
+        def __init__(self, tokens):
+            super().__init__()
+            self.tokens = tokens  # TokenCache: лексема по значению
+
+        def __missing__(self, key):
+            lexeme = key.to_bytes(8, 'little').rstrip(b'\0') if isinstance(key, int) else key
+            token = self[key] = self.tokens[lexeme.decode('utf-8')]
+            return token
+
+    # Классы символов для str.translate; классы символов вне ASCII запоминаются
+    class CharClasses(dict):
+        def __missing__(self, code):
+            char = chr(code)
+            if char.isalpha():
+                value = lextable.ALPHA_CLASS
+            elif char.isdigit():
+                value = lextable.DIGIT_CLASS
+            elif char.isalnum():
+                value = lextable.NUMERIC_CLASS
+            else:
+                value = lextable.OTHER_CLASS
+            self[code] = value
+            return value
+
+    # Ключевые слова и типы данных
+    TW = [
+        "if", "then", "else", "while", "do", "for", "to", "read", "write",
+        "true", "false", "as", "not", "or", "and"
+    ]
+
+    # Типы данных
+    TYPES = [
+        "%", "!", "$"
+    ]
+
+    # Разделители и операторы
+    TD = [
+        "{", "}", "[", "]", "(", ")", ",", ";", ":", "<>", "=", "<", "<=", ">", ">=", "+", "-", "*", "/", "or", "and"
+    ]
+
+    # Классы лексем для быстрого режима: готовые лексемы и первый символ остальных
+    TOKEN_KINDS = dict.fromkeys(TD, 'DELIMITER')
+    TOKEN_KINDS.update(dict.fromkeys(["<>", "=", "<", "<=", ">", ">="], 'REL_OP'))
+    TOKEN_KINDS.update(dict.fromkeys(["+", "-"], 'ADD_OP'))
+    TOKEN_KINDS.update(dict.fromkeys(["*", "/"], 'MUL_OP'))
+    TOKEN_KINDS.update(dict.fromkeys(TYPES, 'TYPE'))
+    TOKEN_KINDS.update(dict.fromkeys(TW, 'KEYWORD'))
+
+    FIRST_KINDS = dict.fromkeys(string.ascii_letters, 'ID')
+    FIRST_KINDS.update(dict.fromkeys(string.digits, 'NUMBER'))
+    FIRST_KINDS["'"] = 'STRING'
+
+    # Один шаблон на все лексемы; комментарий даёт пустую группу,
+    # неизвестный символ захватывается вместе со следующим (как в состоянии ERROR)
+    TOKEN_PATTERN = re.compile(r"""
+        [ \n\r\t]*
+        (?:
+            /(?=\*)(?:.*?\*/|.*)
+          | ( [A-Za-z][A-Za-z0-9_]*
+            | 0(?:[Bb][01]*|[Oo][0-7]*|[Hh][0-9A-Fa-f]*)
+            | [0-9]+(?:[Dd]|\.[0-9]*(?:[Ee][+-]?[0-9]*)?|[Ee][+-]?[0-9]*)?
+            | '[^']*'?
+            | <[>=]? | >=? | [{}\[\](),;:=+\-*/%!$]
+            | [^ \n\r\t].?
+            )
+        )""", re.VERBOSE | re.DOTALL)
+
+    # Таблица ДКА в виде для table_tokens: состояние задаётся началом своей строки
+    TABLE_CLASSES = CharClasses(enumerate(lextable.ASCII_CLASSES))
+    TABLE_TRANSITIONS = array('L', [target * lextable.CLASS_COUNT for target in lextable.TRANSITIONS])
+    TABLE_ACCEPT = [kind for kind in lextable.ACCEPT for _ in range(lextable.CLASS_COUNT)]
+    TABLE_START = lextable.START * lextable.CLASS_COUNT
+
+    # То же для байтов файла, отображённого в память (UTF-8)
+    BYTES_PATTERN = re.compile(TOKEN_PATTERN.pattern.encode(), re.VERBOSE | re.DOTALL)
+    BYTES_KINDS = {lexeme.encode(): kind for lexeme, kind in TOKEN_KINDS.items()}
+    BYTES_FIRST_KINDS = {ord(char): kind for char, kind in FIRST_KINDS.items()}
+
+    # Векторный режим: строки и комментарии (их разбирает шаблон), классы байтов
+    # и маски младших байтов для ключей лексем (PackedTokens)
+    SPECIAL_PATTERN = re.compile(rb"'[^']*'?|/(?=\*)(?:.*?\*/|.*)", re.DOTALL)
+    SPACE_CLASS, WORD_CLASS, OPERATOR_CLASS, OTHER_CLASS, STRING_CLASS = range(5)
+    if numpy is not None:
+        BYTE_CLASSES = numpy.full(256, OTHER_CLASS, dtype=numpy.uint8)
+        BYTE_CLASSES[list(b' \n\r\t')] = SPACE_CLASS
+        BYTE_CLASSES[list((string.ascii_letters + string.digits + '_').encode())] = WORD_CLASS
+        BYTE_CLASSES[list(b"{}[](),;:=<>+-*/%!$")] = OPERATOR_CLASS
+        KEY_MASKS = numpy.array([(1 << 8 * length) - 1 for length in range(9)], dtype=numpy.uint64)
+
+    def __init__(self, input_text):
+        self.text = input_text
+        self.pos = 0
+        self.current_char = self.text[self.pos] if self.text else None
+        self.tokens = []
+        self.state = self.LexerState.H  # Начальное состояние
+        self.stream = None  # Последний результат tokenize_stream (для update)
+        self.changed = None  # Лексемы, заменённые последним update: (начало, старый конец, новый конец)
+
+    # Лексер над файлом, отображённым в память: текст не копируется в строку,
+    # разбор идёт прямо по байтам, значения декодируются при обращении к лексеме
+    @classmethod
+    def from_path(cls, path):
+        lexer = cls('')
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                lexer.text = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return lexer
+
+    # Обработка ввода и переход к следующему символу
+    def advance_position(self):
+        self.pos += 1
+        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
+
+    def append_token(self, token_type, value):
+        self.tokens.append((token_type, value))
+
+    def skip_whitespace(self):
+        while self.current_char and self.current_char in ' \n\r\t':
+            self.advance_position()
+    # Переходы между состояниями
+    def process_state(self):
+        if self.state == self.LexerState.H:
+            self.skip_whitespace()
+            if not self.current_char:
+                self.state = self.LexerState.END  # Завершаем анализ
+                return
+            if self.current_char in self.TYPES:
+                self.state = self.LexerState.ALE
+            elif self.current_char.isalpha():
+                self.state = self.LexerState.ID
+            elif self.current_char.isdigit():
+                self.state = self.LexerState.NUM
+            elif self.current_char == "'":
+                self.state = self.LexerState.STR
+            elif self.current_char == '/' and self.text[self.pos + 1:self.pos + 2] == '*':
+                self.state = self.LexerState.COM
+            elif self.current_char in self.TD:
+                self.state = self.LexerState.DELIM
+            else:
+                self.state = self.LexerState.ERROR  # Ошибка при неправильном символе
+                self.append_token('ERROR', f"Unexpected character: {self.current_char}")
+                self.advance_position()
+
+        elif self.state == self.LexerState.ID:
+            self.handle_identifier_or_keyword()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.NUM:
+            self.handle_number()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.STR:
+            self.handle_string()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.COM:
+            self.handle_comment()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.ALE:
+            self.handle_type_symbol()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.DELIM:
+            self.handle_delimiter_or_operator()
+            self.state = self.LexerState.H
+
+        elif self.state == self.LexerState.ERROR:
+            # Ошибка в состоянии, можно добавить обработку или выход из цикла
+            self.append_token('ERROR', f"Unexpected character: {self.current_char}")
+            self.state = self.LexerState.H  # Переход к началу после ошибки
+            self.advance_position()
+    def handle_identifier_or_keyword(self):
+        start = self.pos
+        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
+            self.advance_position()
+        text = self.text[start:self.pos]
+        if text in self.TYPES:
+            self.append_token('TYPE', text)
+        elif text in self.TW:
+            self.append_token('KEYWORD', text)
+        else:
+            self.append_token('ID', intern(text))
+
+    def handle_number(self):
+        start = self.pos
+        if self.current_char == '0':  # Возможные специальные форматы
+            self.advance_position()
+            if self.current_char and self.current_char in 'Bb':  # Двоичное число
+                self.advance_position()
+                while self.current_char and self.current_char in '01':
+                    self.advance_position()
+                self.append_token('NUMBER', self.text[start:self.pos])
+                return
+            elif self.current_char and self.current_char in 'Oo':  # Восьмеричное число
+                self.advance_position()
+                while self.current_char and self.current_char in '01234567':
+                    self.advance_position()
+                self.append_token('NUMBER', self.text[start:self.pos])
+                return
+            elif self.current_char and self.current_char in 'Hh':  # Шестнадцатеричное число
+                self.advance_position()
+                while self.current_char and (self.current_char.isdigit() or self.current_char in 'ABCDEFabcdef'):
+                    self.advance_position()
+                self.append_token('NUMBER', self.text[start:self.pos])
+                return
+
+        is_real = False
+        while self.current_char and self.current_char.isdigit():
+            self.advance_position()
+        if self.current_char == '.':  # Возможное действительное число
+            is_real = True
+            self.advance_position()
+            while self.current_char and self.current_char.isdigit():
+                self.advance_position()
+        if self.current_char and self.current_char in 'Ee':  # Порядок
+            is_real = True
+            self.advance_position()
+            if self.current_char and self.current_char in '+-':
+                self.advance_position()
+            while self.current_char and self.current_char.isdigit():
+                self.advance_position()
+        if is_real:
+            self.append_token('NUMBER', self.text[start:self.pos])
+            return
+        if self.current_char and self.current_char in 'Dd':  # Десятичное число с суффиксом
+            self.advance_position()
+            self.append_token('NUMBER', self.text[start:self.pos])
+            return
+
+        self.append_token('NUMBER', self.text[start:self.pos])
+
+    def handle_comment(self):
+        self.advance_position()  # Спускаемся с /*
+        while self.current_char and not (self.current_char == '*' and self.text[self.pos + 1:self.pos + 2] == '/'):
+            self.advance_position()
+        self.advance_position()  # Спускаемся на *
+        self.advance_position()  # И на /
+
+    def handle_delimiter_or_operator(self):
+        start = self.pos
+        self.advance_position()
+        while self.current_char and (self.text[start:self.pos + 1] in self.TD):
+            self.advance_position()
+        text = self.text[start:self.pos]
+        if text in ["<>", "=", "<", "<=", ">", ">="]:
+            self.append_token('REL_OP', text)
+        elif text in ["+", "-", "or"]:
+            self.append_token('ADD_OP', text)
+        elif text in ["*", "/", "and"]:
+            self.append_token('MUL_OP', text)
+        elif text in self.TD:
+            self.append_token('DELIMITER', text)
+        else:
+            self.append_token('UNKNOWN', text)
+
+    def handle_type_symbol(self):
+        if self.current_char in self.TYPES:
+            self.append_token('TYPE', self.current_char)
+            self.advance_position()
+
+    def handle_string(self):
+        self.advance_position()
+        start = self.pos
+        while self.current_char and self.current_char != "'":
+            self.advance_position()
+        text = self.text[start:self.pos]
+        self.append_token('STRING', f"'{text}'")
+        self.advance_position()
+
+    # Быстрый режим: весь текст разбирается одним скомпилированным шаблоном,
+    # классы лексем берутся из словаря без вызова Python-кода на каждую лексему
+    def scan_tokens(self):
+        values = self.TOKEN_PATTERN.findall(self.text, self.pos)
+        if not self.classify_values(values):
+            return self.scan_table()
+
+        self.pos = len(self.text)
+        self.current_char = None
+        self.state = self.LexerState.END
+        return self.tokens
+
+    # Векторный режим (нужен NumPy) для текстов, где много пробелов и имён: классы
+    # всех байтов находятся одной выборкой по таблице, границы слов и операций —
+    # сравнением соседних байтов. Строки, комментарии и числа с суффиксом, дробной
+    # частью или порядком разбирает шаблон, по одному. Строки Python создаются только
+    # для разных лексем: лексема ищется в кэше по ключу из её байтов (PackedTokens).
+    # Результат совпадает с scan_tokens; текст с ошибками, незакрытой строкой или
+    # не-ASCII символом вне строк и комментариев разбирает scan_tokens
+    def scan_vectorized(self):
+        text = self.text
+        if numpy is None or self.pos or not isinstance(text, str) or not text:
+            return self.scan_tokens()
+        source = text.encode('utf-8')
+        size = len(source)
+        padded = numpy.frombuffer(source + bytes(8), dtype=numpy.uint8)
+        codes = padded[:size]
+        classes = self.BYTE_CLASSES[padded]  # Нулевые байты в конце — OTHER_CLASS
+        string_starts = string_ends = None
+        if b"'" in source or b'/*' in source:
+            regions = ([], [], [], [])  # Начала и концы строк, начала и концы комментариев
+            for match in self.SPECIAL_PATTERN.finditer(source):
+                start, end = match.span()
+                if source[start] != ord("'"):
+                    regions[2].append(start)
+                    regions[3].append(end)
+                elif end - start == 1 or source[end - 1] != ord("'"):
+                    return self.scan_tokens()  # Незакрытая строка
+                else:
+                    regions[0].append(start)
+                    regions[1].append(end)
+            string_starts, string_ends, comment_starts, comment_ends = (numpy.array(region, dtype=numpy.int64) for region in regions)
+            classes[:size][self.inside(comment_starts, comment_ends, size)] = self.SPACE_CLASS
+            classes[:size][self.inside(string_starts, string_ends, size)] = self.STRING_CLASS
+
+        word = classes == self.WORD_CLASS
+        starts_mask = classes[:size] == self.OPERATOR_CLASS
+        starts_mask[0] |= word[0]
+        starts_mask[1:] |= word[1:size] & ~word[:size - 1]
+        # Вторые символы операций <> <= >= не начинают лексему
+        angles = numpy.flatnonzero(((codes == ord('<')) | (codes == ord('>'))) & starts_mask)
+        following = padded[angles + 1]
+        joined = angles[(classes[angles + 1] == self.OPERATOR_CLASS) & (
+            (following == ord('=')) | ((following == ord('>')) & (codes[angles] == ord('<'))))]
+        if numpy.isin(joined + 1, joined).any():
+            return self.scan_tokens()  # Цепочка вроде '<>=': пары зависят друг от друга
+        starts_mask[joined + 1] = False
+        if string_starts is not None:
+            starts_mask[string_starts] = True
+        starts = numpy.flatnonzero(starts_mask)
+        ends = starts + 1
+        is_word = word[starts]
+        ends[is_word] = numpy.flatnonzero(word[:size] & ~word[1:size + 1]) + 1
+        ends[numpy.searchsorted(starts, joined)] += 1
+        if string_starts is not None:
+            ends[numpy.searchsorted(starts, string_starts)] = string_ends
+
+        # Слово с '_' в начале — пара ошибок; слово с цифры — число
+        first = codes[starts]
+        if (is_word & (first == ord('_'))).any():
+            return self.scan_tokens()
+        numbers = numpy.flatnonzero(is_word & (first <= ord('9')))
+        spans = numpy.zeros((2, 0), dtype=numpy.int64)  # Числа, разобранные шаблоном
+        if len(numbers):
+            digits = numpy.zeros(size + 1, dtype=numpy.int32)
+            numpy.cumsum(codes - ord('0') < 10, out=digits[1:])
+            number_starts, number_ends = starts[numbers], ends[numbers]
+            plain = (digits[number_ends] - digits[number_starts] == number_ends - number_starts) & (
+                padded[number_ends] != ord('.'))
+            complex_numbers = numbers[~plain]
+            if len(complex_numbers):
+                pattern = self.BYTES_PATTERN
+                extended = []
+                stop = 0
+                for index, start, end in zip(complex_numbers.tolist(), starts[complex_numbers].tolist(),
+                                             ends[complex_numbers].tolist()):
+                    if start < stop:
+                        continue  # Часть предыдущего числа
+                    stop = pattern.match(source, start).end(1)
+                    if stop < end or (stop > end and word[stop - 1] and word[stop]):
+                        return self.scan_tokens()  # Число кончается посреди слова
+                    if stop > end:
+                        ends[index] = stop
+                        extended.append((start, stop))
+                if extended:
+                    spans = numpy.array(extended, dtype=numpy.int64).T
+                    # Лексемы внутри чисел, продолженных точкой или знаком порядка
+                    covered = numpy.zeros(len(starts) + 1, dtype=numpy.int32)
+                    numpy.add.at(covered, numpy.searchsorted(starts, spans[0], side='right'), 1)
+                    numpy.add.at(covered, numpy.searchsorted(starts, spans[1]), -1)
+                    keep = numpy.cumsum(covered[:-1]) == 0
+                    starts, ends = starts[keep], ends[keep]
+        # Прочие символы (точка, не-ASCII, неизвестные) допустимы только внутри чисел
+        others = numpy.flatnonzero(classes[:size] == self.OTHER_CLASS)
+        if len(others):
+            span = numpy.searchsorted(spans[0], others, side='right') - 1
+            if (span < 0).any() or (others >= spans[1][span]).any():
+                return self.scan_tokens()
+
+        lengths = ends - starts
+        words = numpy.ndarray((size,), dtype='<u8', buffer=padded, strides=(1,))
+        keys = (words[starts] & self.KEY_MASKS[numpy.minimum(lengths, 8)]).tolist()
+        long = numpy.flatnonzero(lengths > 8)
+        for index, start, end in zip(long.tolist(), starts[long].tolist(), ends[long].tolist()):
+            keys[index] = source[start:end]
+        tokens = self.PackedTokens(self.TokenCache(self.TOKEN_KINDS, self.FIRST_KINDS))
+        self.tokens.extend(map(tokens.__getitem__, keys))
+
+        self.pos = len(self.text)
+        self.current_char = None
+        self.state = self.LexerState.END
+        return self.tokens
+
+    # Маска байтов внутри участков [starts[i], ends[i]) (участки не пересекаются)
+    @staticmethod
+    def inside(starts, ends, size):
+        marks = numpy.zeros(size + 1, dtype=numpy.int8)
+        marks[starts] += 1
+        marks[ends] -= 1
+        return numpy.cumsum(marks[:size], dtype=numpy.int8).view(bool)
+
+    # Добавление лексем по их значениям; False (и ничего не добавлено), если
+    # встретился не-ASCII символ вне строк и комментариев
+    def classify_values(self, values):
+        tokens = self.TokenCache(self.TOKEN_KINDS, self.FIRST_KINDS)
+        count = len(self.tokens)
+        # Пустые значения — комментарии
+        self.tokens.extend(map(tokens.__getitem__, filter(None, values)))
+        if tokens.irregular:
+            del self.tokens[count:]
+            if not self.collect_values(values):
+                del self.tokens[count:]
+                return False
+        return True
+
+    # Быстрый режим с компактным результатом: TokenStream вместо списка кортежей
+    def tokenize_stream(self):
+        stream = TokenStream(self.text)
+        if not self.scan_into(stream, self.pos):
+            # Не-ASCII символ вне строк и комментариев: isalpha()/isdigit()
+            # автомата шире шаблона, такой текст разбирается по таблице ДКА
+            text = self.text if isinstance(self.text, str) else str(self.text, 'utf-8')
+            stream = type(self)(text).scan_table_stream()
+
+        self.pos = len(self.text)
+        self.current_char = None
+        self.state = self.LexerState.END
+        self.stream = stream
+        return stream
+
+    # Разбор шаблоном с позиции start в буферы stream. Для лексем, начинающихся
+    # не раньше resync_from, вызывается resync(offset): True останавливает разбор.
+    # Возвращает False, если встретился не-ASCII символ вне строк и комментариев
+    def scan_into(self, stream, start, resync=None, resync_from=None):
+        error = stream.CODES['ERROR']
+        if isinstance(self.text, str):
+            pattern = self.TOKEN_PATTERN
+            kinds = self.TokenKinds(self.TOKEN_KINDS, self.FIRST_KINDS)
+        else:
+            pattern = self.BYTES_PATTERN
+            kinds = self.TokenKinds(self.BYTES_KINDS, self.BYTES_FIRST_KINDS)
+        if resync_from is None:
+            resync_from = len(self.text) + 1
+        append_kind = stream.kinds.append
+        append_offset = stream.offsets.append
+        append_length = stream.lengths.append
+        long = stream.LONG
+        for match in pattern.finditer(self.text, start):
+            value = match.group(1)
+            if value is None:  # Комментарий
+                continue
+            code = kinds[value]
+            offset = match.start(1)
+            if offset >= resync_from and code is not None and resync(offset):
+                return True
+            if code is None:
+                if not value[:1].isascii():
+                    return False
+                # Пара ошибок: неизвестный символ и следующий за ним
+                append_kind(error)
+                append_offset(offset)
+                append_length(1)
+                append_kind(error)
+                append_offset(offset + 1)
+                append_length(len(value) - 1)
+                continue
+            length = len(value)
+            if length >= long:
+                stream.long_lengths[len(stream.kinds)] = length
+                length = long
+            append_kind(code)
+            append_offset(offset)
+            append_length(length)
+        return True
+
+    # Повторный разбор после правки text[edit_start:edit_end] = new_text (строковый текст).
+    # Разбирается только повреждённый участок: с начала лексемы, которую правка может
+    # продолжить, до первой лексемы после правки, совпавшей по началу со старой.
+    # Начала лексем (кроме второй в паре ошибок) лежат вне строк и комментариев,
+    # поэтому с них разбор можно начинать заново
+    def update(self, edit_start, edit_end, new_text):
+        if self.stream is None:
+            self.tokenize_stream()
+        stream = self.stream
+        delta = len(new_text) - (edit_end - edit_start)
+
+        first = stream.find(edit_start) - 1
+        while first > 0 and stream.kind(first) == 'ERROR':
+            first -= 1  # Пара ошибок могла начаться раньше
+        first = max(first, 0)
+        restart = stream.offset(first) if first > 0 else 0
+
+        self.text = self.text[:edit_start] + new_text + self.text[edit_end:]
+        self.stream = None  # Пока разбор не закончен, поток не соответствует тексту
+        fresh = TokenStream(self.text)
+        synced = []
+
+        def resync(offset):
+            index = stream.find(offset - delta)
+            if index < len(stream) and stream.offset(index) == offset - delta and stream.kind(index) != 'ERROR':
+                synced.append(index)
+                return True
+            return False
+
+        if not self.scan_into(fresh, restart, resync, edit_start + len(new_text)):
+            # Полный разбор, но в тот же объект потока: на него могут ссылаться
+            # (например, IncrementalSyntax)
+            self.pos = 0
+            fresh = self.tokenize_stream()
+            first, stop = 0, len(stream)
+        else:
+            stop = synced[0] if synced else len(stream)
+        self.changed = (first, stop, first + len(fresh))
+        stream.splice(first, stop, fresh, delta)
+        stream.source = self.text
+        stream.lines = None
+        self.stream = stream
+        return stream
+
+    # Разбор по таблице ДКА из lextable.py (см. lexgen.py): на каждый символ —
+    # один переход, сколько бы ни было ключевых слов и операций. Выдаёт
+    # (класс, смещение, длина) так же, как автомат: символы вне ASCII
+    # различаются по isalpha()/isdigit(), неизвестный символ даёт пару ошибок
+    def table_tokens(self, start=0):
+        text = self.text
+        end = len(text)
+        codes = text.translate(self.TABLE_CLASSES).encode('latin-1')
+        transitions = self.TABLE_TRANSITIONS
+        accept = self.TABLE_ACCEPT
+        pos = start
+        while pos < end:
+            state = self.TABLE_START
+            index = stop = pos
+            kind = None
+            while index < end:
+                state = transitions[state + codes[index]]
+                if not state:
+                    break
+                index += 1
+                if accept[state]:
+                    kind, stop = accept[state], index
+            if kind is None:
+                yield 'ERROR', pos, 1
+                yield 'ERROR', pos + 1, 1 if pos + 1 < end else 0
+                pos += 2
+                continue
+            if kind != 'SPACE' and kind != 'COMMENT':
+                yield kind, pos, stop - pos
+            pos = stop
+
+    def scan_table_stream(self):
+        stream = TokenStream(self.text)
+        for kind, offset, length in self.table_tokens(self.pos):
+            stream.append(kind, offset, length)
+        return stream
+
+    def scan_table(self):
+        text = self.text
+        append = self.tokens.append
+        for kind, offset, length in self.table_tokens(self.pos):
+            value = text[offset:offset + length]
+            if kind == 'ERROR':
+                value = f"Unexpected character: {value or None}"
+            elif kind == 'STRING' and (length == 1 or value[-1] != "'"):
+                value += "'"  # Незакрытая строка
+            elif kind == 'ID':
+                value = intern(value)
+            append((kind, value))
+        self.pos = len(self.text)
+        self.current_char = None
+        self.state = self.LexerState.END
+        return self.tokens
+
+    # Поштучная классификация лексем, найденных шаблоном: нужна, когда в тексте
+    # есть ошибки или незакрытая строка, и при потоковом разборе
+    def collect_values(self, values):
+        kinds = self.TOKEN_KINDS
+        first_kinds = self.FIRST_KINDS
+        append = self.tokens.append
+        for value in values:
+            kind = kinds.get(value)
+            if kind is None:
+                if not value:  # Комментарий
+                    continue
+                kind = first_kinds.get(value[0])
+                if kind is None:
+                    if not value[0].isascii():
+                        # Не-ASCII символ вне строк и комментариев: isalpha()/isdigit()
+                        # автомата шире шаблона, такой текст разбирает автомат
+                        return False
+                    append(('ERROR', f"Unexpected character: {value[0]}"))
+                    append(('ERROR', f"Unexpected character: {value[1] if len(value) > 1 else None}"))
+                    continue
+                if kind == 'STRING' and (len(value) == 1 or value[-1] != "'"):
+                    value += "'"  # Незакрытая строка
+                elif kind == 'ID':
+                    value = intern(value)
+            append((kind, value))
+        return True
+
+    # Потоковый разбор текстового файла частями по chunk_size символов.
+    # Лексема, упёршаяся в конец части, переносится в следующую вместе с хвостом
+    @classmethod
+    def iter_tokens(cls, fileobj, chunk_size=1 << 16):
+        tail = ''
+        while True:
+            chunk = fileobj.read(chunk_size)
+            lexer = cls(tail + chunk)
+            if not chunk:
+                yield from lexer.tokenize()
+                return
+            tail = lexer.scan_chunk()
+            yield from lexer.tokens
+
+    # Разбор одной части потока; возвращает необработанный хвост
+    def scan_chunk(self):
+        end = len(self.text)
+        stop = end
+        values = []
+        pending = ''
+        for match in self.TOKEN_PATTERN.finditer(self.text):
+            if match.end() >= end:
+                stop = match.start()
+                pending = match.group(1) or ''
+                break
+            values.append(match.group(1) or '')
+        # Не-ASCII символ в начале перенесённой лексемы мог продолжать предыдущую
+        if not pending[:1].isascii() or not self.collect_values(values):
+            self.tokens.clear()
+            return self.shrink_tail(self.step_automaton())
+        return self.shrink_tail(self.text[stop:])
+
+    # Автомат по лексемам, пока очередная лексема не упрётся в конец части
+    def step_automaton(self):
+        while True:
+            start, count = self.pos, len(self.tokens)
+            self.process_state()  # Пробелы и выбор состояния
+            if self.state == self.LexerState.END:
+                return ''
+            self.process_state()
+            if self.pos >= len(self.text):
+                del self.tokens[count:]
+                return self.text[start:]
+
+    # Незакрытый комментарий в хвосте заменяется его началом, чтобы хвост не рос.
+    # Последняя '*' сохраняется: она может закрыть комментарий с '/' из следующей части
+    @staticmethod
+    def shrink_tail(tail):
+        body = tail.lstrip(' \n\r\t')
+        if body.startswith('/*') and body.find('*/', 1) == -1:
+            return '/**' if body.endswith('*') else '/* '
+        return tail
+
+    # Циклическая обработка входной строки
+    def run_automaton(self):
+        while self.state != self.LexerState.END:
+            self.process_state()
+
+        # Если есть ошибка, токены ошибки тоже добавляются
+        if self.state == self.LexerState.ERROR:
+            self.append_token('ERROR', "Unexpected end of input")
+
+        return self.tokens
+
+    # vectorized=True — векторный режим (scan_vectorized); без NumPy это scan_tokens
+    def tokenize(self, fast=True, vectorized=False):
+        if not isinstance(self.text, str):
+            return list(self.tokenize_stream())
+        if fast and vectorized:
+            return self.scan_vectorized()
+        if fast:
+            return self.scan_tokens()
+        return self.run_automaton()
+
+
+# Параллельный разбор большого текста пулом процессов. Текст режется на части
+# по переводам строк; каждая часть разбирается так, будто перед ней автомат в
+# состоянии H, и дочитывается до первой лексемы следующей части. При сборке
+# часть принимается с лексемы, с которой совпадает настоящий разбор; если граница
+# попала в строку или комментарий, до такого совпадения текст разбирается
+# последовательно. Результат совпадает с Lexer(text).tokenize_stream()
+def parallel_tokenize(text, workers=None, parts_per_worker=4):
+    workers = workers or os.cpu_count() or 1
+    count = workers * parts_per_worker
+    starts = [0]
+    for part in range(1, count):
+        boundary = text.find('\n', len(text) * part // count) + 1
+        if boundary > starts[-1]:
+            starts.append(boundary)
+    stops = starts[1:] + [len(text)]
+    with ProcessPoolExecutor(workers, initializer=init_part_worker, initargs=(text,)) as pool:
+        parts = list(pool.map(scan_part, starts, stops))
+
+    lexer = Lexer(text)
+    stream = TokenStream(text)
+    error = TokenStream.CODES['ERROR']
+    frontier = 0  # Настоящий разбор дошёл сюда в состоянии H
+    index = 0
+    while frontier < len(text):
+        if index < len(parts):
+            kinds, offsets, lengths, long_lengths, stop = parts[index]
+            if frontier >= stop:
+                index += 1
+                continue
+            first = 0 if frontier == starts[index] else bisect_left(offsets, frontier)
+            aligned = frontier == starts[index] or (
+                first < len(offsets) and offsets[first] == frontier and kinds[first] != error)
+        else:
+            aligned = False  # Последняя часть оборвалась на не-ASCII символе
+        if not aligned:
+            synced = []
+
+            def resync(offset):
+                part = bisect_right(starts, offset) - 1
+                found = bisect_left(parts[part][1], offset)
+                if found < len(parts[part][1]) and parts[part][1][found] == offset and parts[part][0][found] != error:
+                    synced.append((part, found))
+                    return True
+                return False
+
+            if not lexer.scan_into(stream, frontier, resync, frontier):
+                return lexer.tokenize_stream()
+            if not synced:
+                break  # Последовательный разбор дошёл до конца текста
+            index, first = synced[0]
+            kinds, offsets, lengths, long_lengths, stop = parts[index]
+        for part_index, length in long_lengths.items():
+            if part_index >= first:
+                stream.long_lengths[len(stream) + part_index - first] = length
+        stream.kinds.extend(kinds[first:])
+        stream.offsets.extend(offsets[first:])
+        stream.lengths.extend(lengths[first:])
+        frontier = stop
+        index += 1
+    return stream
+
+
+part_text = None  # Текст в процессе пула (передаётся один раз при запуске)
+
+
+def init_part_worker(text):
+    global part_text
+    part_text = text
+
+
+# Разбор части [start, stop) в процессе пула: буферы лексем (как у TokenStream) и
+# смещение, до которого они покрывают текст (первая лексема следующей части)
+def scan_part(start, stop):
+    part = TokenStream(part_text)
+    ended = []
+
+    def resync(offset):
+        ended.append(offset)
+        return True
+
+    complete = Lexer(part_text).scan_into(part, start, resync, stop)
+    if not complete:
+        # Не-ASCII символ вне строк и комментариев: часть обрывается на последней
+        # лексеме перед ним (он мог её продолжить), дальше разбирает parallel_tokenize
+        last = len(part) - 1
+        while last >= 0 and part.kinds[last] == part.CODES['ERROR']:
+            last -= 1
+        if last < 0:
+            return part.kinds[:0], part.offsets[:0], part.lengths[:0], {}, start
+        long_lengths = {index: length for index, length in part.long_lengths.items() if index < last}
+        return part.kinds[:last], part.offsets[:last], part.lengths[:last], long_lengths, part.offsets[last]
+    return part.kinds, part.offsets, part.lengths, part.long_lengths, ended[0] if ended else len(part_text)
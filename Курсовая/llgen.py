@@ -0,0 +1,242 @@
+import os
+import re
+from array import array
+from lex import TokenStream
+
+# Генератор LL(1)-анализатора: читает грамматику из README.md, строит множества
+# FIRST/FOLLOW и записывает предсказывающую таблицу в lltable.py. После изменения
+# грамматики в README таблицу нужно пересоздать: python llgen.py
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+START = '<программа>'
+# Нетерминалы, которые лексер выдаёт одной лексемой: при разборе это терминалы —
+# классы лексем. Остальные терминалы узнаются по значению лексемы
+LEXEMES = {'<идентификатор>': 'ID', '<число>': 'NUMBER', '<строка>': 'STRING'}
+END = '$end'  # Конец текста
+OTHER = '$other'  # Лексема, которой нет в грамматике
+RULE = re.compile(r"^(?:\d+\.\s*)?(<[^<>\s]+>)::=\s*(.*)$")
+# «x» — терминал в кавычках, {/ ... /} — повторение не менее одного раза,
+# { ... } — ноль и более раз, [ ... ] — необязательная часть, ( ... ) — группа
+SYMBOL = re.compile(r"«[^»]*»|<[^<>\s]+>|\{/|/\}|[{}\[\]()|]|[^\s{}\[\]()|«»]+")
+CLOSING = {'(': ')', '{': '}', '{/': '/}', '[': ']'}
+
+
+# Правила «<имя>::= ...» из текста README
+def read_rules(text):
+    rules = {}
+    for line in text.splitlines():
+        match = RULE.match(line.strip())
+        if match:
+            # Перевода строки в потоке лексем нет: разделитель «перевод строки» пустой
+            rules[match.group(1)] = match.group(2).replace('перевод строки', '')
+    return rules
+
+
+# Перевод правил РБНФ в БНФ: повторения, необязательные части и группы
+# заменяются вспомогательными нетерминалами вида <имя.номер>
+class GrammarReader:
+    def __init__(self, rules):
+        self.rules = rules
+        self.productions = []  # (левая часть, кортеж символов правой части)
+        self.helpers = {}  # (конструкция, альтернативы) -> вспомогательный нетерминал
+        self.nonterminals = []
+
+    def read(self, start):
+        pending = [start]
+        while pending:
+            name = pending.pop()
+            if name in self.nonterminals:
+                continue
+            if name not in self.rules:
+                raise ValueError(f"No rule for {name}")
+            self.nonterminals.append(name)
+            self.name = name
+            self.symbols = SYMBOL.findall(self.rules[name])
+            self.pos = 0
+            count = len(self.productions)
+            alternatives = self.parse_alternatives()
+            if self.pos != len(self.symbols):
+                raise ValueError(f"Unexpected '{self.symbols[self.pos]}' in {name}")
+            self.productions.extend((name, alternative) for alternative in alternatives)
+            # Нетерминалы из правила и его вспомогательных продукций
+            pending.extend(symbol for _, right_side in self.productions[count:]
+                           for symbol in right_side if symbol in self.rules)
+        return self.productions
+
+    def peek(self):
+        return self.symbols[self.pos] if self.pos < len(self.symbols) else None
+
+    def parse_alternatives(self):
+        alternatives = [self.parse_sequence()]
+        while self.peek() == '|':
+            self.pos += 1
+            alternatives.append(self.parse_sequence())
+        return alternatives
+
+    def parse_sequence(self):
+        sequence = []
+        while self.peek() not in (None, '|', ')', '}', '/}', ']'):
+            symbol = self.symbols[self.pos]
+            self.pos += 1
+            if symbol in CLOSING:
+                alternatives = self.parse_alternatives()
+                if self.peek() != CLOSING[symbol]:
+                    raise ValueError(f"Missing '{CLOSING[symbol]}' in {self.name}")
+                self.pos += 1
+                sequence.extend(self.construct(symbol, alternatives))
+            elif symbol.startswith('«'):
+                sequence.append(symbol[1:-1])
+            else:
+                sequence.append(LEXEMES.get(symbol, symbol))
+        return tuple(sequence)
+
+    # Символы, которыми в правой части заменяется конструкция
+    def construct(self, kind, alternatives):
+        if kind == '(':
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return self.helper('(', alternatives, alternatives)
+        if kind == '[':
+            return self.helper('[', alternatives, alternatives + [()])
+        if kind == '{/':
+            return self.construct('(', alternatives) + self.construct('{', alternatives)
+        key = ('{', tuple(alternatives))
+        if key not in self.helpers:
+            helper = self.new_helper(key)
+            self.productions.extend((helper, alternative + (helper,)) for alternative in alternatives)
+            self.productions.append((helper, ()))
+        return (self.helpers[key],)
+
+    def helper(self, kind, alternatives, right_sides):
+        key = (kind, tuple(alternatives))
+        if key not in self.helpers:
+            helper = self.new_helper(key)
+            self.productions.extend((helper, right_side) for right_side in right_sides)
+        return (self.helpers[key],)
+
+    def new_helper(self, key):
+        count = sum(helper.startswith(self.name[:-1] + '.') for helper in self.nonterminals)
+        helper = f"{self.name[:-1]}.{count + 1}>"
+        self.helpers[key] = helper
+        self.nonterminals.append(helper)
+        return helper
+
+
+def first_of(sequence, first, nullable):
+    result = set()
+    for symbol in sequence:
+        if symbol not in first:
+            result.add(symbol)
+            return result, False
+        result |= first[symbol]
+        if symbol not in nullable:
+            return result, False
+    return result, True
+
+
+# FIRST и FOLLOW нетерминалов и множество нетерминалов, выводящих пустую цепочку
+def first_follow(productions, start):
+    first = {name: set() for name, _ in productions}
+    follow = {name: set() for name in first}
+    follow[start].add(END)
+    nullable = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, right_side in productions:
+            symbols, empty = first_of(right_side, first, nullable)
+            if not symbols <= first[name] or empty and name not in nullable:
+                first[name] |= symbols
+                if empty:
+                    nullable.add(name)
+                changed = True
+    changed = True
+    while changed:
+        changed = False
+        for name, right_side in productions:
+            for index, symbol in enumerate(right_side):
+                if symbol not in follow:
+                    continue
+                symbols, empty = first_of(right_side[index + 1:], first, nullable)
+                if empty:
+                    symbols |= follow[name]
+                if not symbols <= follow[symbol]:
+                    follow[symbol] |= symbols
+                    changed = True
+    return first, follow, nullable
+
+
+# Предсказывающая таблица {(нетерминал, терминал): номер продукции}.
+# Конфликт пустой и непустой продукции (висячий else) решается в пользу непустой,
+# остальные конфликты — ошибка грамматики
+def build_table(productions, first, follow, nullable):
+    table = {}
+    resolved = []
+    for number, (name, right_side) in enumerate(productions):
+        symbols, empty = first_of(right_side, first, nullable)
+        if empty:
+            symbols |= follow[name]
+        for terminal in symbols:
+            other = table.setdefault((name, terminal), number)
+            if other == number:
+                continue
+            if not right_side or not productions[other][1]:
+                if not productions[other][1]:
+                    table[name, terminal] = number
+                resolved.append((name, terminal))
+            else:
+                raise ValueError(f"Grammar is not LL(1): {name} on '{terminal}'")
+    return table, resolved
+
+
+def write_table(path, readme):
+    with open(readme, encoding='utf-8') as file:
+        rules = read_rules(file.read())
+    reader = GrammarReader(rules)
+    productions = reader.read(START)
+    first, follow, nullable = first_follow(productions, START)
+    table, resolved = build_table(productions, first, follow, nullable)
+
+    # Терминалы и нетерминалы — целые числа: сначала терминалы, затем нетерминалы
+    terminals = [END, OTHER] + sorted({symbol for _, right_side in productions
+                                       for symbol in right_side if symbol not in first})
+    nonterminals = reader.nonterminals
+    codes = {symbol: code for code, symbol in enumerate(terminals + nonterminals)}
+    cells = array('h', [-1] * (len(nonterminals) * len(terminals)))
+    for (name, terminal), number in table.items():
+        cells[(codes[name] - len(terminals)) * len(terminals) + codes[terminal]] = number
+    kind_terminals = [codes[kind] if kind in LEXEMES.values() and kind in codes else -1
+                      for kind in TokenStream.KINDS]
+    value_terminals = {terminal: codes[terminal] for terminal in terminals[2:]
+                       if terminal not in LEXEMES.values()}
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("# Таблица LL(1)-анализатора, созданная llgen.py по грамматике из README.md. Не редактировать вручную\n")
+        file.write("from array import array\n\n")
+        file.write(f"# Символ s — терминал TERMINALS[s] при s < TERMINAL_COUNT, иначе нетерминал NONTERMINALS[s - TERMINAL_COUNT]\n")
+        file.write(f"TERMINALS = {terminals!r}\n")
+        file.write(f"NONTERMINALS = {nonterminals!r}\n")
+        file.write(f"TERMINAL_COUNT = {len(terminals)}\n")
+        file.write(f"END, OTHER = 0, 1\n")
+        file.write(f"START = {codes[START]}\n")
+        file.write("# Продукции: (левая часть, правая часть)\n")
+        file.write("PRODUCTIONS = [\n")
+        for name, right_side in productions:
+            file.write(f"    ({codes[name]}, {tuple(codes[symbol] for symbol in right_side)!r}),\n")
+        file.write("]\n")
+        file.write("# Продукция для нетерминала n и терминала t: TABLE[n * TERMINAL_COUNT + t], -1 — ошибка\n")
+        file.write("TABLE = array('h', [\n")
+        for row in range(len(nonterminals)):
+            file.write("    " + ", ".join(map(str, cells[row * len(terminals):(row + 1) * len(terminals)])) + ",\n")
+        file.write("])\n")
+        file.write("# Терминал лексемы: по коду класса (TokenStream.CODES), -1 — по значению лексемы\n")
+        file.write(f"KIND_TERMINALS = {kind_terminals!r}\n")
+        file.write(f"VALUE_TERMINALS = {value_terminals!r}\n")
+    return len(productions), len(terminals), len(nonterminals), resolved
+
+
+if __name__ == "__main__":
+    productions, terminals, nonterminals, resolved = write_table(os.path.join(DIRECTORY, 'lltable.py'),
+                                                                 os.path.join(DIRECTORY, 'README.md'))
+    print(f"lltable.py: {productions} продукций, {terminals} терминалов, {nonterminals} нетерминалов")
+    for name, terminal in resolved:
+        print(f"Конфликт {name} / '{terminal}' решён в пользу непустой продукции")
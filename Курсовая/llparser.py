@@ -0,0 +1,69 @@
+from lex import TokenStream
+from lltable import TERMINALS, NONTERMINALS, TERMINAL_COUNT, END, OTHER, START, PRODUCTIONS, TABLE, \
+    KIND_TERMINALS, VALUE_TERMINALS
+
+NUMBER = TERMINALS.index('NUMBER')
+# Правые части продукций в обратном порядке — в таком порядке они кладутся на стек
+PUSHED = [tuple(reversed(right_side)) for _, right_side in PRODUCTIONS]
+
+
+# Номер терминала для лексемы (None — конец текста)
+def token_terminal(token):
+    if token is None:
+        return END
+    terminal = KIND_TERMINALS[TokenStream.CODES[token[0]]]
+    if terminal < 0:
+        terminal = VALUE_TERMINALS.get(token[1], OTHER)
+    return terminal
+
+
+def symbol_name(symbol):
+    if symbol == END:
+        return "end of program"
+    if symbol < TERMINAL_COUNT:
+        return TERMINALS[symbol]
+    return NONTERMINALS[symbol - TERMINAL_COUNT]
+
+
+# Номер нетерминала name (строка таблицы)
+def symbol_number(name):
+    return NONTERMINALS.index(name)
+
+
+# Сообщение об ошибке: лексема token не подходит к символу symbol на вершине стека
+def unexpected(symbol, token):
+    if symbol < TERMINAL_COUNT:
+        return f"Expected {symbol_name(symbol)}, got {token}"
+    row = (symbol - TERMINAL_COUNT) * TERMINAL_COUNT
+    expected = [TERMINALS[other] for other in range(TERMINAL_COUNT) if TABLE[row + other] >= 0]
+    return f"Unexpected {token if token else 'end of program'} in {symbol_name(symbol)}, " \
+           f"expected one of: {' '.join(expected)}"
+
+
+# Табличный LL(1)-анализатор по грамматике README (таблица — lltable.py, см. llgen.py).
+# Проверяет программу одним циклом со стеком символов, без построения дерева.
+# Класс-наследник определяет get_current_token(), move_to_next_token(), error(сообщение)
+# и parse_number() — проверку формата числа, которую грамматика разбора оставляет лексеру
+class LLParser:
+    def check_program(self):
+        stack = [END, START]
+        token = self.get_current_token()
+        terminal = token_terminal(token)
+        while stack:
+            symbol = stack.pop()
+            if symbol < TERMINAL_COUNT:
+                if symbol != terminal:
+                    raise self.error(unexpected(symbol, token))
+                if symbol == END:
+                    return
+                if symbol == NUMBER:
+                    self.parse_number()
+                else:
+                    self.move_to_next_token()
+                token = self.get_current_token()
+                terminal = token_terminal(token)
+                continue
+            number = TABLE[(symbol - TERMINAL_COUNT) * TERMINAL_COUNT + terminal]
+            if number < 0:
+                raise self.error(unexpected(symbol, token))
+            stack.extend(PUSHED[number])
@@ -0,0 +1,111 @@
+# Таблица LL(1)-анализатора, созданная llgen.py по грамматике из README.md. Не редактировать вручную
+from array import array
+
+# Символ s — терминал TERMINALS[s] при s < TERMINAL_COUNT, иначе нетерминал NONTERMINALS[s - TERMINAL_COUNT]
+TERMINALS = ['$end', '$other', '!', '$', '%', '(', ')', '*', '+', ',', '-', '/', ':', ';', '<', '<=', '<>', '=', '>', '>=', 'ID', 'NUMBER', 'STRING', '[', ']', 'and', 'as', 'do', 'else', 'false', 'for', 'if', 'not', 'or', 'read', 'then', 'to', 'true', 'while', 'write', '{', '}']
+NONTERMINALS = ['<программа>', '<программа.1>', '<программа.2>', '<оператор>', '<вывода>', '<вывода.1>', '<выражение>', '<выражение.1>', '<операнд>', '<операнд.1>', '<слагаемое>', '<слагаемое.1>', '<множитель>', '<унарная_операция>', '<логическая_константа>', '<операции_группы_умножения>', '<операции_группы_сложения>', '<операции_группы_отношения>', '<ввода>', '<ввода.1>', '<условного_цикла>', '<фиксированного_цикла>', '<присваивания>', '<условный>', '<условный.1>', '<составной>', '<составной.1>', '<составной.2>', '<описание>', '<тип>']
+TERMINAL_COUNT = 42
+END, OTHER = 0, 1
+START = 42
+# Продукции: (левая часть, правая часть)
+PRODUCTIONS = [
+    (43, (70,)),
+    (43, (45,)),
+    (44, (43, 13, 44)),
+    (44, ()),
+    (42, (40, 43, 13, 44, 41)),
+    (45, (67,)),
+    (45, (64,)),
+    (45, (65,)),
+    (45, (63,)),
+    (45, (62,)),
+    (45, (60,)),
+    (45, (46,)),
+    (47, (9, 48, 47)),
+    (47, ()),
+    (46, (39, 5, 48, 47, 6)),
+    (49, (59, 50, 49)),
+    (49, ()),
+    (48, (50, 49)),
+    (51, (58, 52, 51)),
+    (51, ()),
+    (50, (52, 51)),
+    (53, (57, 54, 53)),
+    (53, ()),
+    (52, (54, 53)),
+    (54, (20,)),
+    (54, (21,)),
+    (54, (56,)),
+    (54, (55, 54)),
+    (54, (5, 48, 6)),
+    (54, (22,)),
+    (55, (32,)),
+    (56, (37,)),
+    (56, (29,)),
+    (57, (7,)),
+    (57, (11,)),
+    (57, (25,)),
+    (58, (8,)),
+    (58, (10,)),
+    (58, (33,)),
+    (59, (16,)),
+    (59, (17,)),
+    (59, (14,)),
+    (59, (15,)),
+    (59, (18,)),
+    (59, (19,)),
+    (61, (9, 20, 61)),
+    (61, ()),
+    (60, (34, 5, 20, 61, 6)),
+    (62, (38, 48, 27, 45)),
+    (63, (30, 64, 36, 48, 27, 45)),
+    (64, (20, 26, 48)),
+    (66, (28, 45)),
+    (66, ()),
+    (65, (31, 48, 35, 45, 66)),
+    (68, (12,)),
+    (68, ()),
+    (69, (68, 45, 69)),
+    (69, ()),
+    (67, (23, 45, 69, 24)),
+    (70, (71, 20, 61)),
+    (71, (4,)),
+    (71, (2,)),
+    (71, (3,)),
+]
+# Продукция для нетерминала n и терминала t: TABLE[n * TERMINAL_COUNT + t], -1 — ошибка
+TABLE = array('h', [
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4, -1,
+    -1, -1, 0, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, 1, -1, -1, -1, -1, -1, -1, 1, 1, -1, -1, 1, -1, -1, -1, 1, 1, -1, -1,
+    -1, -1, 2, 2, 2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 2, -1, -1, 2, -1, -1, -1, -1, -1, -1, 2, 2, -1, -1, 2, -1, -1, -1, 2, 2, -1, 3,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6, -1, -1, 5, -1, -1, -1, -1, -1, -1, 8, 7, -1, -1, 10, -1, -1, -1, 9, 11, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 14, -1, -1,
+    -1, -1, -1, -1, -1, -1, 13, -1, -1, 12, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, 17, 17, -1, -1, -1, -1, -1, -1, 17, -1, -1, 17, -1, -1, -1, -1, 17, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, 16, -1, -1, 16, -1, -1, 16, 16, 15, 15, 15, 15, 15, 15, 16, -1, -1, 16, 16, -1, -1, 16, 16, -1, 16, 16, -1, -1, 16, 16, 16, -1, 16, 16, -1, -1,
+    -1, -1, -1, -1, -1, 20, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 20, 20, 20, -1, -1, -1, -1, -1, -1, 20, -1, -1, 20, -1, -1, -1, -1, 20, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, 19, -1, 18, 19, 18, -1, 19, 19, 19, 19, 19, 19, 19, 19, 19, -1, -1, 19, 19, -1, -1, 19, 19, -1, 19, 19, -1, 18, 19, 19, 19, -1, 19, 19, -1, -1,
+    -1, -1, -1, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 23, 23, 23, -1, -1, -1, -1, -1, -1, 23, -1, -1, 23, -1, -1, -1, -1, 23, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, 22, 21, 22, 22, 22, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, -1, -1, 22, 22, 21, -1, 22, 22, -1, 22, 22, -1, 22, 22, 22, 22, -1, 22, 22, -1, -1,
+    -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 24, 25, 29, -1, -1, -1, -1, -1, -1, 26, -1, -1, 27, -1, -1, -1, -1, 26, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 30, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 32, -1, -1, -1, -1, -1, -1, -1, 31, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, 33, -1, -1, -1, 34, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 35, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, 36, -1, 37, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 41, 42, 39, 40, 43, 44, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 47, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, 46, -1, -1, 45, -1, -1, -1, 46, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 48, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 49, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 50, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 53, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 52, 52, -1, -1, -1, -1, -1, -1, 52, -1, -1, 52, 52, -1, -1, -1, 51, -1, 52, 52, -1, -1, 52, -1, -1, -1, 52, 52, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 58, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 54, -1, -1, -1, -1, -1, -1, -1, 55, -1, -1, 55, -1, -1, -1, -1, -1, -1, 55, 55, -1, -1, 55, -1, -1, -1, 55, 55, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 56, -1, -1, -1, -1, -1, -1, -1, 56, -1, -1, 56, 57, -1, -1, -1, -1, -1, 56, 56, -1, -1, 56, -1, -1, -1, 56, 56, -1, -1,
+    -1, -1, 59, 59, 59, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, 61, 62, 60, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+])
+# Терминал лексемы: по коду класса (TokenStream.CODES), -1 — по значению лексемы
+KIND_TERMINALS = [20, -1, -1, 21, 22, -1, -1, -1, -1, -1, -1]
+VALUE_TERMINALS = {'!': 2, '$': 3, '%': 4, '(': 5, ')': 6, '*': 7, '+': 8, ',': 9, '-': 10, '/': 11, ':': 12, ';': 13, '<': 14, '<=': 15, '<>': 16, '=': 17, '>': 18, '>=': 19, '[': 23, ']': 24, 'and': 25, 'as': 26, 'do': 27, 'else': 28, 'false': 29, 'for': 30, 'if': 31, 'not': 32, 'or': 33, 'read': 34, 'then': 35, 'to': 36, 'true': 37, 'while': 38, 'write': 39, '{': 40, '}': 41}
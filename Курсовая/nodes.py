@@ -0,0 +1,145 @@
+# Узлы дерева разбора, которое строит Syntax. Узлы без __dict__ (только __slots__),
+# значения литералов уже разобраны: числа — int или float, строки — без кавычек,
+# true/false — bool. position — номер первой лексемы узла (для сообщений об ошибках)
+class Node:
+    __slots__ = ('position',)
+
+    def fields(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.fields() == other.fields()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.fields()))})"
+
+
+class Program(Node):
+    __slots__ = ('body',)  # Объявления и операторы в порядке текста
+
+    def __init__(self, position, body):
+        self.position = position
+        self.body = body
+
+
+class Declaration(Node):
+    __slots__ = ('type', 'names')
+
+    def __init__(self, position, type, names):
+        self.position = position
+        self.type = type
+        self.names = names
+
+
+class Assign(Node):
+    __slots__ = ('name', 'value')
+
+    def __init__(self, position, name, value):
+        self.position = position
+        self.name = name
+        self.value = value
+
+
+class If(Node):
+    __slots__ = ('condition', 'then', 'otherwise')  # otherwise — None без else
+
+    def __init__(self, position, condition, then, otherwise):
+        self.position = position
+        self.condition = condition
+        self.then = then
+        self.otherwise = otherwise
+
+
+class While(Node):
+    __slots__ = ('condition', 'body')
+
+    def __init__(self, position, condition, body):
+        self.position = position
+        self.condition = condition
+        self.body = body
+
+
+class For(Node):
+    __slots__ = ('assignment', 'limit', 'body')
+
+    def __init__(self, position, assignment, limit, body):
+        self.position = position
+        self.assignment = assignment
+        self.limit = limit
+        self.body = body
+
+
+class Read(Node):
+    __slots__ = ('names',)
+
+    def __init__(self, position, names):
+        self.position = position
+        self.names = names
+
+
+class Write(Node):
+    __slots__ = ('values',)
+
+    def __init__(self, position, values):
+        self.position = position
+        self.values = values
+
+
+class Compound(Node):
+    __slots__ = ('statements',)
+
+    def __init__(self, position, statements):
+        self.position = position
+        self.statements = statements
+
+
+class Binary(Node):
+    __slots__ = ('operator', 'left', 'right')
+
+    def __init__(self, position, operator, left, right):
+        self.position = position
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+
+class Unary(Node):
+    __slots__ = ('operator', 'operand')
+
+    def __init__(self, position, operator, operand):
+        self.position = position
+        self.operator = operator
+        self.operand = operand
+
+
+class Name(Node):
+    __slots__ = ('name',)
+
+    def __init__(self, position, name):
+        self.position = position
+        self.name = name
+
+
+class Number(Node):
+    __slots__ = ('value', 'text')  # text — запись числа в программе (None — значение свёрнуто, folding.py)
+
+    def __init__(self, position, value, text):
+        self.position = position
+        self.value = value
+        self.text = text
+
+
+class String(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, position, value):
+        self.position = position
+        self.value = value
+
+
+class Boolean(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, position, value):
+        self.position = position
+        self.value = value
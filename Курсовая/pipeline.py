@@ -0,0 +1,185 @@
+import argparse
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from folding import fold_constants
+from lex import Lexer
+from semantic import Semantic
+from syntax import IncrementalSyntax
+
+
+def source_key(source):
+    return hashlib.sha256(source.encode('utf-8')).digest()
+
+
+# Конвейер анализа: лексический, синтаксический и семантический анализ текста
+# выполняются по одному разу, результаты этапов лежат в LRU-кэше по хешу текста
+# (не больше max_sources текстов). Повторный запрос этапа для того же текста
+# ничего не пересчитывает. Новый текст не разбирается с нуля: лексемы и
+# синтаксические ошибки получаются правкой результатов предыдущего текста
+# (Lexer.update, IncrementalSyntax.update)
+class Pipeline:
+    def __init__(self, max_sources=16):
+        self.max_sources = max_sources
+        self.results = OrderedDict()  # Хеш текста -> {этап: результат}
+        self.lexer = None  # Лексер последнего разобранного текста
+        self.lexer_key = None
+        # IncrementalSyntax над потоком self.lexer (создаётся при первом запросе ошибок или дерева)
+        # и его последний результат: список ошибок или SyntaxError
+        self.parser = None
+        self.parser_result = None
+
+    # Результаты этапов для текста; текст становится последним использованным
+    def entry(self, key):
+        entry = self.results.get(key)
+        if entry is None:
+            entry = self.results[key] = {}
+            if len(self.results) > self.max_sources:
+                self.results.popitem(last=False)
+        else:
+            self.results.move_to_end(key)
+        return entry
+
+    # Перевод лексера (и анализатора, если он есть) на текст source
+    def advance(self, source, key):
+        if self.lexer_key == key:
+            return
+        try:
+            if self.lexer is None:
+                self.lexer = Lexer(source)
+                self.lexer.tokenize_stream()
+            else:
+                # update меняет поток на месте: поток старого текста в кэше заменяется копией
+                old_entry = self.results.get(self.lexer_key)
+                if old_entry and old_entry.get('tokens') is self.lexer.stream:
+                    old_entry['tokens'] = self.lexer.stream.copy()
+                # Деревья старого текста делят поддеревья с IncrementalSyntax, update сдвигает
+                # их позиции на месте: такие деревья из кэша убираются (строятся заново по запросу)
+                if old_entry and self.parser is not None:
+                    old_entry.pop('program', None)
+                    old_entry.pop('folded', None)
+                old = self.lexer.text
+                prefix = len(os.path.commonprefix([old, source]))
+                suffix = min(len(os.path.commonprefix([old[::-1], source[::-1]])),
+                             min(len(old), len(source)) - prefix)
+                self.lexer.update(prefix, len(old) - suffix, source[prefix:len(source) - suffix])
+                if self.parser is not None:
+                    self.run_parser(self.parser.update, *self.lexer.changed)
+        except Exception:
+            # Лексер бросил исключение посреди разбора: следующий текст разбирается с нуля
+            self.lexer = self.lexer_key = self.parser = None
+            raise
+        self.lexer_key = key
+
+    def run_parser(self, method, *args):
+        try:
+            self.parser_result = method(*args)
+        except SyntaxError as error:
+            self.parser_result = error
+
+    def stage_tokens(self, source, key, entry):
+        if 'tokens' not in entry:
+            self.advance(source, key)
+            entry['tokens'] = self.lexer.stream
+        return entry['tokens']
+
+    # Поток лексем (TokenStream)
+    def tokens(self, source):
+        key = source_key(source)
+        return self.stage_tokens(source, key, self.entry(key))
+
+    # Перевод лексера и анализатора (IncrementalSyntax) на текст source
+    def stage_parser(self, source, key, entry):
+        self.stage_tokens(source, key, entry)
+        self.advance(source, key)
+        if self.parser is None:
+            self.parser = IncrementalSyntax(self.lexer.stream)
+            self.run_parser(self.parser.parse)
+
+    # Список синтаксических ошибок всех операторов; программа без '{' в начале —
+    # исключение SyntaxError, как у Syntax.parse_with_recovery
+    def errors(self, source):
+        key = source_key(source)
+        entry = self.entry(key)
+        if 'errors' not in entry:
+            self.stage_parser(source, key, entry)
+            entry['errors'] = self.parser_result
+        if isinstance(entry['errors'], SyntaxError):
+            raise entry['errors']
+        return entry['errors']
+
+    # Дерево программы (nodes.py) без сломанных операторов; программа без '{'
+    # в начале — исключение SyntaxError, как в errors. Отдельного разбора нет:
+    # дерево собирается из поддеревьев того же IncrementalSyntax
+    def program(self, source):
+        key = source_key(source)
+        entry = self.entry(key)
+        if 'program' not in entry:
+            self.stage_parser(source, key, entry)
+            if isinstance(self.parser_result, SyntaxError):
+                entry['program'] = self.parser_result
+            else:
+                entry['program'] = self.parser.program()
+        if isinstance(entry['program'], SyntaxError):
+            raise entry['program']
+        return entry['program']
+
+    # Дерево программы со свёрнутыми константами и отчёт о свёртке (folding.py)
+    def folded(self, source):
+        key = source_key(source)
+        entry = self.entry(key)
+        if 'folded' not in entry:
+            entry['folded'] = fold_constants(self.program(source))
+        return entry['folded']
+
+    # Строка с результатом семантического анализа дерева программы (Semantic.analyze).
+    # При синтаксических ошибках анализ не выполняется: в дереве нет сломанных операторов
+    def semantic(self, source):
+        key = source_key(source)
+        entry = self.entry(key)
+        if 'semantic' not in entry:
+            try:
+                errors = self.errors(source)
+            except SyntaxError as error:
+                errors = [error]
+            if errors:
+                entry['semantic'] = f"Семантический анализ не выполнен: синтаксических ошибок {len(errors)}"
+            else:
+                entry['semantic'] = Semantic(self.tokens(source)).analyze(self.program(source))
+        return entry['semantic']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Лексический, синтаксический и семантический анализ программы")
+    parser.add_argument('input', nargs='?', default='-', help="файл с программой (по умолчанию stdin)")
+    arguments = parser.parse_args()
+    if arguments.input == '-':
+        source = sys.stdin.read()
+    else:
+        with open(arguments.input, encoding='utf-8') as file:
+            source = file.read()
+    pipeline = Pipeline()
+    print(f"Лексем: {len(pipeline.tokens(source))}")
+    try:
+        errors = pipeline.errors(source)
+    except SyntaxError as error:
+        errors = [error]
+    print(f"Синтаксических ошибок: {len(errors)}")
+    for error in errors:
+        print(error)
+    print(pipeline.semantic(source))
+    tokens = pipeline.tokens(source)
+    try:
+        folded = pipeline.folded(source)
+    except SyntaxError:
+        folded = None
+    if folded is None:
+        print("Свёртка констант не выполнена: дерево программы не построено")
+    else:
+        _, folds = folded
+        print(f"Свёрнуто константных выражений: {len(folds)}, операций: {sum(operations for _, _, operations in folds)}")
+        for position, value, _ in folds:
+            line, column = tokens.position(position)
+            value = str(value).lower() if isinstance(value, bool) else value
+            print(f"  строка {line}, столбец {column}: {value}")
@@ -0,0 +1,32 @@
+from array import array
+
+# Типы переменных и выражений хранятся кодами; имена нужны только для сообщений
+TYPE_NAMES = ['%', '!', '$', 'STRING']
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+INTEGER, REAL, BOOLEAN, STRING = range(len(TYPE_NAMES))
+
+
+# Таблица символов. Каждое объявление получает номер по порядку; имя разрешается
+# в номер одним поиском в словаре (имена интернирует лексер), тип лежит в массиве
+# по номеру. Область видимости одна — вся программа: грамматика не допускает
+# объявлений внутри составного оператора
+class SymbolTable:
+    def __init__(self):
+        self.ids = {}  # Имя -> номер объявления
+        self.names = []
+        self.types = array('B')
+
+    # Объявление name с кодом типа type_code; номер объявления или -1, если
+    # name уже объявлено
+    def declare(self, name, type_code):
+        if name in self.ids:
+            return -1
+        id = len(self.names)
+        self.ids[name] = id
+        self.names.append(name)
+        self.types.append(type_code)
+        return id
+
+    # Номер объявления name, -1 — не объявлено
+    def resolve(self, name):
+        return self.ids.get(name, -1)
@@ -1,7 +1,75 @@
-class Syntax:
+from array import array
+from bisect import bisect_left, bisect_right
+from llparser import LLParser, token_terminal, symbol_number, unexpected, NUMBER, PUSHED
+from lltable import TERMINALS, NONTERMINALS, TERMINAL_COUNT, START, PRODUCTIONS, TABLE
+from nodes import Node, Program, Declaration, Assign, If, While, For, Read, Write, Compound, Binary, Unary, \
+    Name, Number, String, Boolean
+
+
+# Tree builder for each nonterminal of the README grammar that makes a node. The table
+# driver (Syntax.parse_symbols) calls it when the nonterminal is complete, with the
+# values of all its symbols in order, helper repetitions included: the token of each
+# terminal, the Number node of a number and the value of each nested nonterminal.
+# A nonterminal without a builder has one symbol in each production (or none, for the
+# helpers) and passes its value through; <программа> is put together by parse_program
+BUILDERS = {
+    '<описание>': 'build_declaration',
+    '<присваивания>': 'build_assignment',
+    '<условный>': 'build_if',
+    '<условного_цикла>': 'build_while',
+    '<фиксированного_цикла>': 'build_for',
+    '<ввода>': 'build_input',
+    '<вывода>': 'build_output',
+    '<составной>': 'build_compound',
+    '<выражение>': 'build_operations',
+    '<операнд>': 'build_operations',
+    '<слагаемое>': 'build_operations',
+    '<множитель>': 'build_factor',
+}
+# Builder name for each production (None: no node is built)
+REDUCERS = [BUILDERS.get(NONTERMINALS[left - TERMINAL_COUNT]) for left, _ in PRODUCTIONS]
+for left, right_side in PRODUCTIONS:
+    name = NONTERMINALS[left - TERMINAL_COUNT]
+    if left != START and name not in BUILDERS and '.' not in name and len(right_side) != 1:
+        raise ValueError(f"No tree builder for {name} (syntax.BUILDERS)")
+
+# <программа> ::= { <программа.1> ; <программа.2> }: a top-level item is <программа.1> ;
+# and the list of items goes on while the table expands <программа.2> to something
+_, PROGRAM = PRODUCTIONS[TABLE[symbol_number('<программа>') * TERMINAL_COUNT + TERMINALS.index('{')]]
+ITEM = PROGRAM[1:3]
+ITEMS_ROW = (PROGRAM[3] - TERMINAL_COUNT) * TERMINAL_COUNT
+# <составной> ::= [ <оператор> <составной.2> ]: while its statements are parsed,
+# ']' is on the stack with the builder marker right under it
+_, COMPOUND = PRODUCTIONS[TABLE[symbol_number('<составной>') * TERMINAL_COUNT + TERMINALS.index('[')]]
+COMPOUND_TAIL = COMPOUND[2]
+COMPOUND_END = COMPOUND[3]
+# Empty production of each nonterminal (-1 if none). A nonterminal that can be empty
+# ends at any token the table has no production for; the error is then reported by the
+# next symbol, as a recursive descent parser does, and the statement before it is whole.
+# This also ends an expression at the end of the tokens (parse_expression)
+EMPTY = [-1] * len(NONTERMINALS)
+for number, (left, right_side) in enumerate(PRODUCTIONS):
+    if not right_side:
+        EMPTY[left - TERMINAL_COUNT] = number
+
+
+# Raised when parse_with_recovery has collected max_errors errors
+class ErrorLimitReached(Exception):
+    pass
+
+
+# Parser that builds the program tree (nodes.py) with the LL(1) table generated from
+# the grammar in README (lltable.py): every choice of a production is one table lookup,
+# and the tree comes from the builders above. check_program (llparser.py) runs the
+# same table without building anything, so both accept exactly the same programs
+class Syntax(LLParser):
     def __init__(self, tokens):
         self.tokens = tokens
         self.position = 0
+        self.names = {}  # One string object per identifier, shared by all Name nodes
+        self.errors = None  # List of SyntaxError while parse_with_recovery runs
+        self.max_errors = None
+        self.reducers = [getattr(self, name) if name else None for name in REDUCERS]
 
     def get_current_token(self):
         return self.tokens[self.position] if self.position < len(self.tokens) else None
@@ -11,163 +79,246 @@ class Syntax:
         if token and token[0] == token_type and (value is None or token[1] == value):
             self.position += 1
             return token
-        raise SyntaxError(f"Expected {token_type} {value}, got {token}")
+        raise self.error(f"Expected {token_type} {value}, got {token}")
+
+    # Error with its place in the source, if the tokens know it (TokenStream)
+    def error(self, message):
+        return SyntaxError(message + self.location(self.position))
+
+    def location(self, position):
+        if hasattr(self.tokens, 'position') and position <= len(self.tokens):
+            line, column = self.tokens.position(position)
+            return f" at line {line}, column {column}"
+        return ''
 
     def move_to_next_token(self):
         self.position += 1
 
+    # Panic-mode parse: every error is recorded, the parser skips to the next
+    # ';' or '}' (':' or ']' inside a compound statement) and goes on.
+    # Returns the tree without the broken statements and the list of errors
+    def parse_with_recovery(self, max_errors=100):
+        self.errors = []
+        self.max_errors = max_errors
+        program = None
+        try:
+            program = self.parse_program()
+        except ErrorLimitReached:
+            pass
+        finally:
+            errors, self.errors = self.errors, None
+        return program, errors
+
+    # Records the error if recovering, otherwise raises it
+    def recover(self, error):
+        if self.errors is None:
+            raise error
+        self.errors.append(error)
+        if len(self.errors) >= self.max_errors:
+            raise ErrorLimitReached()
+
+    # Skips tokens up to one of the stop values; returns the stop token value or None at the end
+    def synchronize(self, stops):
+        token = self.get_current_token()
+        while token and token[1] not in stops:
+            self.move_to_next_token()
+            token = self.get_current_token()
+        return token[1] if token else None
+
     def parse_program(self):
+        start = self.position
+        body = []  # Declarations and statements in source order
         self.expect_token('DELIMITER', '{')
-        while self.get_current_token() and self.get_current_token()[1] != '}':
-            token = self.get_current_token()
-            if token[0] == 'TYPE':
-                self.parse_declaration()
-            else:
-                self.parse_statement()
-            self.expect_token('DELIMITER', ';')
-        self.expect_token('DELIMITER', '}')
-
-    def parse_declaration(self):
-        self.expect_token('TYPE')
-        self.parse_identifier_list()
-
-    def parse_identifier_list(self):
-        self.expect_token('ID')
-        while self.get_current_token() and self.get_current_token()[1] == ',':
-            self.expect_token('DELIMITER', ',')
-            self.expect_token('ID')
-
-    def parse_if_statement(self):
-        self.expect_token('KEYWORD', 'if')
-        self.expect_token('DELIMITER', '(')
-        self.parse_expression()
-        self.expect_token('DELIMITER', ')')
-        self.expect_token('KEYWORD', 'then')
-        self.parse_statement()
-        if self.get_current_token() and self.get_current_token()[1] == 'else':
-            self.move_to_next_token()  # Move to 'else'
-            self.parse_statement()  # Handle statement after 'else'
-
-    def parse_statement(self):
         token = self.get_current_token()
-        if token[0] == 'DELIMITER' and token[1] == '[':
-            self.parse_compound_statement()
-        elif token[0] == 'ID':
-            self.parse_assignment()
-        elif token[0] == 'KEYWORD' and token[1] == 'if':
-            self.parse_if_statement()
-        elif token[0] == 'KEYWORD' and token[1] == 'while':
-            self.parse_while_statement()
-        elif token[0] == 'KEYWORD' and token[1] == 'for':
-            self.parse_for_loop()
-        elif token[0] == 'KEYWORD' and token[1] == 'read':
-            self.parse_input_statement()
-        elif token[0] == 'KEYWORD' and token[1] == 'write':
-            self.parse_output_statement()
-        elif token[0] == 'KEYWORD' and token[1] == 'else':
-            raise SyntaxError(f"Unexpected 'else' statement without matching 'if'")
-        else:
-            raise SyntaxError(f"Unexpected statement: {token}")
+        if token and token[1] == '}':
+            self.recover(self.error(f"Expected declaration or statement, got {token}"))
+        while not self.items_end():
+            node = self.parse_item()
+            if node is not None:
+                body.append(node)
+        try:
+            self.expect_token('DELIMITER', '}')
+            self.expect_end()
+        except SyntaxError as error:
+            self.recover(error)
+        return Program(start, body)
+
+    # Nothing may follow the closing '}'
+    def expect_end(self):
+        token = self.get_current_token()
+        if token:
+            raise self.error(f"Unexpected {token} after end of program")
 
-    def parse_compound_statement(self):
-        self.expect_token('DELIMITER', '[')
-        while self.get_current_token() and self.get_current_token()[1] != ']':
-            self.parse_statement()
-            if self.get_current_token() and self.get_current_token()[1] in {':', '\n'}:
+    # The list of items ends here: the tokens are over, or the table expands
+    # <программа.2> to nothing (at the closing '}')
+    def items_end(self):
+        token = self.get_current_token()
+        if token is None:
+            return True
+        number = TABLE[ITEMS_ROW + token_terminal(token)]
+        return number >= 0 and not PRODUCTIONS[number][1]
+
+    # One top-level item: a declaration or statement with its ';'.
+    # Returns None for a broken item (only while recovering)
+    def parse_item(self):
+        try:
+            return self.parse_symbols(ITEM)[0]
+        except SyntaxError as error:
+            self.recover(error)
+            if self.synchronize({';', '}'}) == ';':
                 self.move_to_next_token()
-        self.expect_token('DELIMITER', ']')
-
-    def parse_assignment(self):
-        self.expect_token('ID')
-        self.expect_token('KEYWORD', 'as')
-        self.parse_expression()
-
-    def parse_while_statement(self):
-        self.expect_token('KEYWORD', 'while')
-        self.parse_expression()
-        self.expect_token('KEYWORD', 'do')
-        self.parse_statement()
-
-    def parse_for_loop(self):
-        self.expect_token('KEYWORD', 'for')
-        self.parse_assignment()
-        self.expect_token('KEYWORD', 'to')
-        self.parse_expression()
-        self.expect_token('KEYWORD', 'do')
-        self.parse_statement()
-
-    def parse_input_statement(self):
-        self.expect_token('KEYWORD', 'read')
-        self.expect_token('DELIMITER', '(')
-        self.expect_token('ID')
-        while self.get_current_token() and self.get_current_token()[1] == ',':
-            self.expect_token('DELIMITER', ',')
-            self.expect_token('ID')
-        self.expect_token('DELIMITER', ')')
-
-    def parse_output_statement(self):
-        self.expect_token('KEYWORD', 'write')
-        self.expect_token('DELIMITER', '(')
-        self.parse_expression()
-        while self.get_current_token() and self.get_current_token()[1] == ',':
-            self.expect_token('DELIMITER', ',')
-            self.parse_expression()
-        self.expect_token('DELIMITER', ')')
+            return None
 
+    # Relation, addition and multiplication groups and 'not'
     def parse_expression(self):
-        self.parse_term()
-        while self.get_current_token() and self.get_current_token()[1] in {'+', '-', 'or'}:
-            self.move_to_next_token()
-            self.parse_term()
-        while self.get_current_token() and self.get_current_token()[0] == 'REL_OP':  # Handle relational operators
-            self.move_to_next_token()
-            self.parse_term()
-
-    def parse_term(self):
-        self.parse_factor()
-        while self.get_current_token() and self.get_current_token()[1] in {'*', '/', 'and'}:
-            self.move_to_next_token()
-            self.parse_factor()
-
-    def parse_factor(self):
+        return self.parse_symbols((symbol_number('<выражение>') + TERMINAL_COUNT,))[0]
+
+    # Table-driven LL(1) parse of the symbols in order; returns their values.
+    # The stack holds grammar symbols and, under the right side of a production with
+    # a builder, its marker ~number; frames has the first token and the values height
+    # of each nonterminal being built. No recursion: deep nesting only grows the stacks.
+    # While recovering, an error inside a compound statement is recorded and the parse
+    # goes on from the next ':' or ']' in it; at ';' or '}' the compound is closed as is
+    def parse_symbols(self, symbols):
+        reducers = self.reducers
+        stack = list(reversed(symbols))
+        frames = []
+        values = []
         token = self.get_current_token()
-        if token[0] in {'ID', 'STRING'}:
-            self.move_to_next_token()
-        elif token[0] == 'NUMBER':
-            self.parse_number()
-        elif token[0] == 'KEYWORD' and token[1] in {'true', 'false'}:
-            self.parse_boolean_literal()
-        elif token[0] == 'DELIMITER' and token[1] == '(':
-            self.move_to_next_token()
-            self.parse_expression()
-            self.expect_token('DELIMITER', ')')
-        elif token[0] == 'KEYWORD' and token[1] == 'not':
-            self.move_to_next_token()
-            self.parse_factor()
-        else:
-            raise SyntaxError(f"Unexpected factor: {token}")
-
+        terminal = token_terminal(token)
+        while stack:
+            symbol = stack.pop()
+            try:
+                if symbol < 0:
+                    start, height = frames.pop()
+                    node = reducers[~symbol](start, values[height:])
+                    del values[height:]
+                    values.append(node)
+                elif symbol < TERMINAL_COUNT:
+                    if symbol != terminal:
+                        raise self.error(unexpected(symbol, token))
+                    if symbol == NUMBER:
+                        values.append(self.parse_number())
+                    else:
+                        values.append(token)
+                        self.position += 1
+                    token = self.get_current_token()
+                    terminal = token_terminal(token)
+                else:
+                    number = TABLE[(symbol - TERMINAL_COUNT) * TERMINAL_COUNT + terminal]
+                    if number < 0:
+                        number = EMPTY[symbol - TERMINAL_COUNT]
+                    if number < 0:
+                        raise self.error(unexpected(symbol, token))
+                    if reducers[number] is not None:
+                        stack.append(~number)
+                        frames.append((self.position, len(values)))
+                    stack.extend(PUSHED[number])
+            except SyntaxError as error:
+                stack.append(symbol)
+                close = len(stack) - 1  # ']' of the innermost compound statement
+                while close >= 0 and stack[close] != COMPOUND_END:
+                    close -= 1
+                if close < 0:
+                    raise
+                self.recover(error)
+                # Nonterminals opened in the broken statement are dropped with their values
+                opened = sum(1 for other in stack[close + 1:] if other < 0)
+                if opened:
+                    del values[frames[-opened][1]:]
+                    del frames[-opened:]
+                del stack[close + 1:]
+                if self.synchronize({':', ']', ';', '}'}) in {':', ']'}:
+                    stack.append(COMPOUND_TAIL)
+                else:
+                    stack.pop()  # ']' is missing: the builder marker is on top now
+                token = self.get_current_token()
+                terminal = token_terminal(token)
+        return values
+
+    # Identifier token -> its shared name string
+    def name(self, token):
+        return self.names.setdefault(token[1], token[1])
+
+    # <тип> <идентификатор> { , <идентификатор> }
+    def build_declaration(self, start, values):
+        return Declaration(start, values[0][1], [self.name(token) for token in values[1::2]])
+
+    # <идентификатор> as <выражение>
+    def build_assignment(self, start, values):
+        return Assign(start, self.name(values[0]), values[2])
+
+    # if <выражение> then <оператор> [ else <оператор> ]
+    def build_if(self, start, values):
+        return If(start, values[1], values[3], values[5] if len(values) > 4 else None)
+
+    # while <выражение> do <оператор>
+    def build_while(self, start, values):
+        return While(start, values[1], values[3])
+
+    # for <присваивания> to <выражение> do <оператор>
+    def build_for(self, start, values):
+        return For(start, values[1], values[3], values[5])
+
+    # read ( <идентификатор> { , <идентификатор> } )
+    def build_input(self, start, values):
+        return Read(start, [self.name(token) for token in values[2:-1:2]])
+
+    # write ( <выражение> { , <выражение> } )
+    def build_output(self, start, values):
+        return Write(start, values[2:-1:2])
+
+    # [ <оператор> { [:] <оператор> } ]; ']' is missing in a compound closed by recovery
+    def build_compound(self, start, values):
+        return Compound(start, [value for value in values[1:] if isinstance(value, Node)])
+
+    # <операнд> { <операция> <операнд> } and the like: left-associative operations,
+    # each node starts where the whole group does
+    def build_operations(self, start, values):
+        node = values[0]
+        for index in range(1, len(values), 2):
+            node = Binary(start, values[index][1], node, values[index + 1])
+        return node
+
+    # <идентификатор> | <число> | <логическая_константа> | not <множитель> | ( <выражение> ) | <строка>
+    def build_factor(self, start, values):
+        if len(values) == 3:
+            return values[1]
+        if len(values) == 2:
+            return Unary(start, values[0][1], values[1])
+        token = values[0]
+        if isinstance(token, Node):
+            return token  # Number, built by parse_number
+        if token[0] == 'ID':
+            return Name(start, self.name(token))
+        if token[0] == 'STRING':
+            return String(start, token[1][1:-1])
+        return Boolean(start, token[1] == 'true')
+
+    # Number node with the value already converted to int or float
     def parse_number(self):
+        start = self.position
         token = self.get_current_token()
-        if self.is_binary_number(token):
-            self.move_to_next_token()
-        elif self.is_octal_number(token):
-            self.move_to_next_token()
-        elif self.is_decimal_number(token):
-            self.move_to_next_token()
-        elif self.is_hexadecimal_number(token):
-            self.move_to_next_token()
-        elif self.is_real_number(token):
-            self.move_to_next_token()
-        else:
-            raise SyntaxError(f"Unexpected number format: {token}")
-
-    def parse_boolean_literal(self):
-        token = self.get_current_token()
-        if token[0] == 'KEYWORD' and token[1] in {'true', 'false'}:
-            self.move_to_next_token()
-        else:
-            raise SyntaxError(f"Unexpected boolean literal: {token}")
+        text = token[1] if token else None
+        try:
+            if self.is_binary_number(token):
+                value = int(text[2:] or '0', 2)
+            elif self.is_octal_number(token):
+                value = int(text[2:] or '0', 8)
+            elif self.is_decimal_number(token):
+                value = int(text.rstrip('Dd'))
+            elif self.is_hexadecimal_number(token):
+                value = int(text[2:] or '0', 16)
+            elif self.is_real_number(token):
+                value = float(text)
+            else:
+                value = None
+        except ValueError:
+            value = None  # isdigit() accepts digits such as '²' that int() rejects
+        if value is None:
+            raise self.error(f"Unexpected number format: {token}")
+        self.move_to_next_token()
+        return Number(start, value, text)
 
     def is_binary_number(self, token):
         if token[0] != 'NUMBER':
@@ -222,3 +373,207 @@ class Syntax:
             return True
         except ValueError:
             return False
+
+
+REUSE_LIMIT = 32  # Old items of a larger edited range are parsed again without key lookups
+
+
+# Adds delta to the positions of node and all nodes under it
+def rebase(node, delta):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        node.position += delta
+        for value in node.fields():
+            if isinstance(value, Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, Node))
+
+
+# Parser for a program that is edited and checked again and again (tokens come from
+# Lexer.tokenize_stream and are changed in place by Lexer.update). It keeps the
+# top-level items with their token ranges and content keys, and update() reparses
+# only the items around the changed tokens: the parse stops at the first old item
+# past the edit, and old items from the edited range are reused when their tokens
+# come back. Item starts after the edit are shifted lazily, as in TokenStream, and
+# a reused subtree keeps the positions it was parsed with until program() rebases it
+class IncrementalSyntax(Syntax):
+    def __init__(self, tokens):
+        super().__init__(tokens)
+        self.max_errors = float('inf')
+        self.program_start = 0  # Index of '{'
+        self.starts = array('q')  # First token of each item (shifted lazily, see item_start)
+        self.shift_from = 0
+        self.shift = 0
+        self.bases = array('q')  # Item start when its subtree was parsed
+        self.keys = []  # (length, has a next token, content hash) of each item, see item_key
+        self.nodes = []  # Subtree of each item, None for a broken item
+        self.item_errors = []  # (message, position from the item start) for each item
+        self.error_items = array('q')  # Indices of the items with errors, ascending
+        self.end = 0  # Index of the token after the last item ('}' in a correct program)
+
+    # Message only: the location is added when the errors are listed,
+    # since a reused item may have moved
+    def error(self, message):
+        error = SyntaxError(message)
+        error.position = self.position
+        return error
+
+    def item_start(self, index):
+        if index >= self.shift_from:
+            return self.starts[index] + self.shift
+        return self.starts[index]
+
+    # Index of the last item starting at or before position (-1 if none)
+    def find_item(self, position):
+        index = bisect_right(self.starts, position, 0, self.shift_from)
+        if index == self.shift_from:
+            index = bisect_right(self.starts, position - self.shift, self.shift_from)
+        return index - 1
+
+    # Items [start, stop) are replaced with items starting at starts (new positions);
+    # the following items move by delta tokens
+    def splice(self, start, stop, starts, delta):
+        if self.shift_from < start:
+            self.add_to_starts(self.shift_from, start, self.shift)
+        elif self.shift_from > stop:
+            self.add_to_starts(stop, self.shift_from, -self.shift)
+        self.starts[start:stop] = starts
+        self.shift_from = start + len(starts)
+        self.shift += delta
+
+    def add_to_starts(self, start, stop, delta):
+        if delta:
+            self.starts[start:stop] = array('q', [position + delta for position in self.starts[start:stop]])
+
+    # Key of the item [start, stop): its token kinds and text up to the token after it,
+    # which the parse looks at too
+    def item_key(self, start, stop):
+        tokens = self.tokens
+        last = min(stop, len(tokens) - 1)
+        text = tokens.source[tokens.offset(start):tokens.offset(last) + tokens.length(last)]
+        return stop - start, stop < len(tokens), hash((tokens.kinds[start:last + 1].tobytes(), text))
+
+    # Full parse; returns the list of errors
+    def parse(self):
+        self.position = 0
+        self.program_start = None  # Until '{' is found, every update is a full parse
+        try:
+            self.expect_token('DELIMITER', '{')
+        except SyntaxError as error:
+            raise SyntaxError(str(error) + self.location(error.position))
+        self.program_start = 0
+        self.starts = array('q')
+        self.shift_from = self.shift = 0
+        self.bases = array('q')
+        self.keys, self.nodes, self.item_errors = [], [], []
+        self.error_items = array('q')
+        self.parse_items(0, 0, 0, {})
+        return self.get_errors()
+
+    # Tokens [first, old_stop) were replaced with [first, new_stop) (Lexer.changed
+    # after Lexer.update); returns the list of errors
+    def update(self, first, old_stop, new_stop):
+        if self.program_start is None or first <= self.program_start:
+            return self.parse()
+        if first > self.end:
+            return self.get_errors()  # Only tokens after the program changed
+        delta = new_stop - old_stop
+        start = max(self.find_item(first), 0)
+        if start < len(self.starts) and self.item_start(start) == first and start > 0:
+            start -= 1  # The previous item looked at the changed token
+        stop = self.find_item(old_stop - 1) + 1  # First item that does not touch the edit
+        stop = max(stop, start)
+        # Old items of the edited range by content key: reused if their tokens reappear
+        reusable = {}
+        for index in range(start, stop):
+            reusable.setdefault(self.keys[index], index)
+        self.parse_items(start, stop, delta, reusable)
+        return self.get_errors()
+
+    # Parses items from the place of old item start and puts them in place of the old
+    # ones; stops at '}', at the end, or at an old item from stop on (moved by delta)
+    # that begins where the parse is
+    def parse_items(self, start, stop, delta, reusable):
+        count = len(self.starts)
+        self.position = self.item_start(start) if start < count else self.program_start + 1
+        # Keys are compared by computing the key of each possible length at the parse position
+        lengths = {length for length, _, _ in reusable} if len(reusable) <= REUSE_LIMIT else ()
+        starts, bases, keys, nodes, item_errors = array('q'), array('q'), [], [], []
+        synced = stop
+        while True:
+            while synced < count and self.item_start(synced) + delta < self.position:
+                synced += 1
+            if synced < count and self.item_start(synced) + delta == self.position:
+                break
+            if self.items_end():
+                synced = count
+                break
+            item_start = self.position
+            index = None
+            for length in lengths:
+                if item_start + length <= len(self.tokens):
+                    key = self.item_key(item_start, item_start + length)
+                    if key in reusable:
+                        index = reusable.pop(key)
+                        break
+            if index is not None:
+                self.position = item_start + self.keys[index][0]
+                starts.append(item_start)
+                bases.append(self.bases[index])
+                keys.append(self.keys[index])
+                nodes.append(self.nodes[index])
+                item_errors.append(self.item_errors[index])
+                continue
+            self.errors = []
+            node = self.parse_item()
+            errors, self.errors = self.errors, None
+            starts.append(item_start)
+            bases.append(item_start)
+            keys.append(self.item_key(item_start, self.position))
+            nodes.append(node)
+            item_errors.append([(str(error), error.position - item_start) for error in errors])
+
+        low = bisect_left(self.error_items, start)
+        high = bisect_left(self.error_items, synced)
+        moved = len(starts) - (synced - start)
+        self.error_items[low:] = array('q', [start + index for index, errors in enumerate(item_errors) if errors] +
+                                       [index + moved for index in self.error_items[high:]])
+        if synced < count:
+            self.end += delta
+        else:
+            self.end = self.position
+        self.splice(start, synced, starts, delta)
+        self.bases[start:synced] = bases
+        self.keys[start:synced] = keys
+        self.nodes[start:synced] = nodes
+        self.item_errors[start:synced] = item_errors
+
+    # Errors of all items and of the program end ('}' missing or followed by tokens),
+    # with their current places; in the same order as parse_with_recovery gives them
+    def get_errors(self):
+        errors = []
+        token = self.tokens[self.end] if self.end < len(self.tokens) else None
+        if not self.starts and token and token[1] == '}':
+            errors.append(SyntaxError(f"Expected declaration or statement, got {token}" + self.location(self.end)))
+        for index in self.error_items:
+            start = self.item_start(index)
+            errors.extend(SyntaxError(message + self.location(start + offset))
+                          for message, offset in self.item_errors[index])
+        if not (token and token[0] == 'DELIMITER' and token[1] == '}'):
+            errors.append(SyntaxError(f"Expected DELIMITER }}, got {token}" + self.location(self.end)))
+        elif self.end + 1 < len(self.tokens):
+            errors.append(SyntaxError(f"Unexpected {self.tokens[self.end + 1]} after end of program" +
+                                      self.location(self.end + 1)))
+        return errors
+
+    # Tree of the whole program; subtrees of moved items are rebased first
+    def program(self):
+        for index, node in enumerate(self.nodes):
+            start = self.item_start(index)
+            if self.bases[index] != start:
+                if node is not None:
+                    rebase(node, start - self.bases[index])
+                self.bases[index] = start
+        return Program(self.program_start, [node for node in self.nodes if node is not None])